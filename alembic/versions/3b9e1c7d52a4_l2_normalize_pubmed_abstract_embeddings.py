@@ -0,0 +1,35 @@
+"""l2-normalize pubmed_abstracts embeddings
+
+Revision ID: 3b9e1c7d52a4
+Revises: f0ccb024a181
+Create Date: 2026-10-16 10:12:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e1c7d52a4'
+down_revision: Union[str, Sequence[str], None] = 'f0ccb024a181'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # semantic_search ranks by inner product (<#>), which equals cosine only for
+    # unit vectors. New rows are normalized by embed(); bring existing rows in line.
+    op.execute(
+        "UPDATE pubmed_abstracts SET embedding = l2_normalize(embedding) "
+        "WHERE embedding IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Intentionally irreversible: the original vector norms are not kept, so
+    # this is a no-op. The earlier schema reads unit vectors fine (they rank
+    # identically under cosine distance), so downgrading past it stays safe.
+    pass
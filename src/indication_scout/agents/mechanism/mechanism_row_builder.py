@@ -6,6 +6,8 @@ data + per-(target, disease) evidences and returns dict rows shaped for select_t
 Kept separate from mechanism_candidates.py so the classifier module has no OT / I/O dependencies.
 """
 
+import heapq
+
 from indication_scout.data_sources.open_targets import OpenTargetsClient
 
 
@@ -26,11 +28,11 @@ async def build_candidate_rows(
     target_function = (
         target.function_descriptions[0] if target.function_descriptions else ""
     )
-    top = sorted(
+    top = heapq.nlargest(
+        top_n,
         target.associations,
         key=lambda a: a.overall_score or 0.0,
-        reverse=True,
-    )[:top_n]
+    )
     efo_ids = [a.disease_id for a in top if a.disease_id]
     ev_map = await ot_client.get_target_evidences(target_id, efo_ids)
     return [
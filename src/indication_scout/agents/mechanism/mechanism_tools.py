@@ -4,6 +4,7 @@ Uses content_and_artifact so typed Python objects are preserved on msg.artifact.
 data via a closure-scoped store dict. No InjectedState, no LangGraph state machinery.
 """
 
+import heapq
 import logging
 
 from langchain_core.tools import tool
@@ -92,7 +93,9 @@ def build_mechanism_tools() -> list:
                 for k in MECHANISM_SIGNAL_KEYS
             )
         ]
-        top = sorted(filtered, key=lambda a: a.overall_score or 0, reverse=True)[:_settings.mechanism_associations_cap]
+        top = heapq.nlargest(
+            _settings.mechanism_associations_cap, filtered, key=lambda a: a.overall_score or 0
+        )
 
         fetched = store.setdefault("fetched_associations", {})
         for a in top:
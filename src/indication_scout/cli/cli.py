@@ -4,6 +4,7 @@ Exposes the `scout` command declared in `pyproject.toml` under `[project.scripts
 
 Usage:
     scout find -d <drug> [--out-dir DIR] [--no-write]
+    scout prune-cache [--max-mb N]
 """
 
 import asyncio
@@ -144,6 +145,23 @@ def find(
     asyncio.run(_run_for_drug(drug, out_dir, write=not no_write, date_before=cutoff))
 
 
+@cli.command("prune-cache")
+@click.option(
+    "--max-mb",
+    type=click.IntRange(min=0),
+    default=None,
+    help="After dropping expired entries, evict least recently used ones until the cache fits.",
+)
+def prune_cache(max_mb: int | None) -> None:
+    """Delete expired and unreachable entries from the shared disk cache."""
+    from indication_scout.constants import DEFAULT_CACHE_DIR
+    from indication_scout.utils.cache import cache_prune
+
+    max_bytes = max_mb * 1024 * 1024 if max_mb is not None else None
+    removed = cache_prune(DEFAULT_CACHE_DIR, max_bytes=max_bytes)
+    click.echo(f"Removed {removed} cache entries from {DEFAULT_CACHE_DIR}")
+
+
 def main() -> None:
     """Console-script entry point referenced by `pyproject.toml`."""
     _load_env()
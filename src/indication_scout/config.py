@@ -41,6 +41,15 @@ class Settings(BaseSettings):
     small_llm_model: str = "claude-haiku-4-5-20251001"
     big_llm_model: str = "claude-opus-4-6"
     embedding_model: str = "FremyCompany/BioLORD-2023"
+    # "torch" (default) or "onnx". With "onnx", embedding_onnx_file selects the
+    # exported graph inside the model dir, e.g. "onnx/model_qint8_avx512_vnni.onnx"
+    # for int8 dynamic quantization; None uses the unquantized onnx/model.onnx.
+    embedding_backend: str = "torch"
+    embedding_onnx_file: str | None = None
+    # Run the torch backend in FP16. Opt-in only: FP16 vectors differ slightly
+    # from FP32 ones, so stored abstracts, cached query vectors and the trial_risk
+    # fingerprints must all come from the same precision. Requires CUDA.
+    embedding_fp16: bool = False
 
     # App Settings
     debug: bool = False
@@ -65,6 +74,7 @@ class Settings(BaseSettings):
     pubmed_search_default_max_results: int
     pubmed_esummary_batch_size: int
     pubmed_efetch_batch_size: int
+    embedding_batch_size: int
     rag_llm_concurrency: int
     rag_pubmed_concurrency: int
     rag_disease_concurrency: int
@@ -7,12 +7,15 @@ Provides: retry with exponential backoff and session management.
 import asyncio
 import logging
 import sys
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 import aiohttp
+import orjson
 
 from indication_scout.config import get_settings
 from indication_scout.constants import DEFAULT_CACHE_DIR
@@ -21,6 +24,51 @@ logger = logging.getLogger("indication_scout.data_sources")
 
 _settings = get_settings()
 
+# Keep-alive connection pools shared by every client session on a given event
+# loop. Clients are short-lived (one per RetrievalService call, per supervisor
+# branch), so without sharing each one re-does DNS + TCP + TLS to the same
+# hosts. Keyed by loop because aiohttp connectors are loop-bound. A connector is
+# closed once its last open session closes, so nothing is left unclosed when the
+# loop shuts down.
+_shared_connectors: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.TCPConnector
+] = weakref.WeakKeyDictionary()
+_connector_sessions: weakref.WeakKeyDictionary[
+    aiohttp.TCPConnector, int
+] = weakref.WeakKeyDictionary()
+_DNS_CACHE_TTL_SECONDS: int = 300
+# aiohttp's 15s default drops idle sockets between agent turns, where an LLM
+# call often sits between two requests to the same host.
+_KEEPALIVE_TIMEOUT_SECONDS: float = 60.0
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """aiohttp json_serialize hook: orjson, decoded since aiohttp expects str."""
+    return orjson.dumps(obj).decode()
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the running loop's shared TCPConnector, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    connector = _shared_connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+        _shared_connectors[loop] = connector
+    return connector
+
+
+async def _release_shared_connector(connector: aiohttp.BaseConnector) -> None:
+    """Drop one session's hold on a shared connector; close it when none remain."""
+    remaining = _connector_sessions.get(connector, 1) - 1
+    if remaining > 0:
+        _connector_sessions[connector] = remaining
+        return
+    _connector_sessions.pop(connector, None)
+    await connector.close()
+
 
 def log_data_source_failure(
     source: str,
@@ -140,12 +188,24 @@ class BaseClient(ABC):
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # connector_owner=False: closing this client's session must not tear
+            # down the pool other clients on the loop are still using.
+            connector = _get_shared_connector()
+            _connector_sessions[connector] = _connector_sessions.get(connector, 0) + 1
+            self._session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                connector_owner=False,
+                json_serialize=_orjson_dumps,
+            )
         return self._session
 
     async def close(self) -> None:
         if self._session and not self._session.closed:
+            connector = self._session.connector
             await self._session.close()
+            if connector is not None:
+                await _release_shared_connector(connector)
 
     async def __aenter__(self):
         return self
@@ -164,8 +224,13 @@ class BaseClient(ABC):
         json_body: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         as_text: bool = False,
+        consume: Callable[[aiohttp.ClientResponse], Awaitable[Any]] | None = None,
     ) -> Any:
-        """Make HTTP request with retry. Returns parsed JSON, raw text, or raises DataSourceError."""
+        """Make HTTP request with retry. Returns parsed JSON, raw text, or raises DataSourceError.
+
+        With consume, a successful response is handed to consume(resp) instead, and its
+        result is returned; transport errors raised while it reads the body are retried.
+        """
         last_error: Exception | None = None
         # Build once: identifying field summary used in retry warnings and
         # in the persistent failure log so a reader can tell which call
@@ -225,10 +290,19 @@ class BaseClient(ABC):
                         resp.status,
                     )
 
-                return await resp.text() if as_text else await resp.json()
+                if consume is not None:
+                    return await consume(resp)
+                if as_text:
+                    return await resp.text()
+                # orjson straight off the body bytes: Open Targets GraphQL payloads run to
+                # megabytes, and resp.json() would decode them to str before parsing.
+                return orjson.loads(await resp.read())
 
             except asyncio.TimeoutError:
                 last_error = DataSourceError(self._source_name, "Request timeout")
+            except orjson.JSONDecodeError as e:
+                # Typically an HTML error page served with a 200; retry like a transport error.
+                last_error = DataSourceError(self._source_name, f"Invalid JSON response: {e}")
             except aiohttp.ClientError as e:
                 last_error = DataSourceError(
                     self._source_name, f"Connection error: {e}"
@@ -283,3 +357,12 @@ class BaseClient(ABC):
     async def _rest_get_xml(self, url: str, params: dict[str, Any]) -> str:
         """REST GET that returns XML text instead of JSON."""
         return await self._request("GET", url, params=params, as_text=True)
+
+    async def _rest_get_streamed(
+        self,
+        url: str,
+        params: dict[str, Any],
+        consume: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+    ) -> Any:
+        """REST GET whose body is read by consume(resp) as it arrives, not buffered."""
+        return await self._request("GET", url, params=params, consume=consume)
@@ -160,8 +160,13 @@ class ChEMBLClient(BaseClient):
         """Fetch molecule data by ChEMBL ID.
 
         Hits GET /molecule/{chembl_id}.json and returns a MoleculeData instance.
+        Results are cached under namespace "molecule" for CACHE_TTL seconds.
         Raises DataSourceError if the molecule is not found or the response is malformed.
         """
+        cached = cache_get("molecule", {"chembl_id": chembl_id}, self.cache_dir)
+        if cached is not None:
+            return MoleculeData.model_validate(cached)
+
         url = f"{CHEMBL_BASE_URL}/molecule/{chembl_id}.json"
         try:
             raw = await self._rest_get(url, params={})
@@ -186,7 +191,7 @@ class ChEMBLClient(BaseClient):
 
         hierarchy = raw.get("molecule_hierarchy") or {}
 
-        return MoleculeData(
+        result = MoleculeData(
             molecule_chembl_id=raw["molecule_chembl_id"],
             pref_name=(raw.get("pref_name") or "").lower(),
             parent_chembl_id=hierarchy.get("parent_chembl_id", ""),
@@ -199,6 +204,15 @@ class ChEMBLClient(BaseClient):
             molecule_synonyms=synonyms,
         )
 
+        cache_set(
+            "molecule",
+            {"chembl_id": chembl_id},
+            result.model_dump(),
+            self.cache_dir,
+            ttl=CACHE_TTL,
+        )
+        return result
+
 class _OTSearchClient(BaseClient):
     """Minimal client for Open Targets GraphQL search.
 
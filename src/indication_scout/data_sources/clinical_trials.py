@@ -419,7 +419,7 @@ class ClinicalTrialsClient(BaseClient):
 
         # Temporal holdout: restrict to trials that started before cutoff
         if date_before:
-            date_str = date_before.strftime("%Y-%m-%d")
+            date_str = date_before.isoformat()
             term = params.get("query.term", "")
             date_filter = f"AREA[StartDate]RANGE[MIN, {date_str}]"
             params["query.term"] = (
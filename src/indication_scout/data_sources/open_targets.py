@@ -193,7 +193,7 @@ class OpenTargetsClient(BaseClient):
         if cached:
             return DrugData.model_validate(cached)
 
-        async with ChEMBLClient() as chembl_client:
+        async with ChEMBLClient(cache_dir=self.cache_dir) as chembl_client:
             drug_data, molecule, names_result = await asyncio.gather(
                 self._fetch_drug(chembl_id),
                 chembl_client.get_molecule(chembl_id),
@@ -247,7 +247,9 @@ class OpenTargetsClient(BaseClient):
             "min_stage": min_stage,
             "date_before": date_before.isoformat() if date_before else None,
         }
-        cached = cache_get("competitors_raw", cache_params, self.cache_dir)
+        cached = await asyncio.to_thread(
+            cache_get, "competitors_raw", cache_params, self.cache_dir
+        )
         if cached is not None:
             return CompetitorRawData(
                 diseases={
@@ -337,7 +339,8 @@ class OpenTargetsClient(BaseClient):
             drug_indications=drug_indications,
         )
 
-        cache_set(
+        await asyncio.to_thread(
+            cache_set,
             "competitors_raw",
             cache_params,
             {
@@ -372,13 +375,18 @@ class OpenTargetsClient(BaseClient):
 
     async def get_target_data(self, target_id: str) -> TargetData:
         """Fetch target data by ID."""
-        cached = cache_get("target", {"target_id": target_id}, self.cache_dir)
+        # Target entries carry every association and run to megabytes; read and write them off the
+        # event loop so concurrent supervisor branches keep their HTTP calls moving.
+        cached = await asyncio.to_thread(
+            cache_get, "target", {"target_id": target_id}, self.cache_dir
+        )
         if cached:
             return TargetData.model_validate(cached)
 
         target_data = await self._fetch_target(target_id)
 
-        cache_set(
+        await asyncio.to_thread(
+            cache_set,
             "target",
             {"target_id": target_id},
             target_data.model_dump(),
@@ -524,8 +532,18 @@ class OpenTargetsClient(BaseClient):
         return result
 
     async def get_disease_synonyms(self, disease_name: str) -> DiseaseSynonyms:
-        """Fetch exact and related synonyms for a disease by name."""
-        disease_id = await self._resolve_disease_name(disease_name)
+        """Fetch exact and related synonyms for a disease by name.
+
+        The name → ID step goes through resolve_disease_id, so a repeat lookup
+        ("CML" vs "cml ") is served from the disease_id_resolver and
+        disease_synonyms caches without a round-trip.
+        """
+        disease_id = await self.resolve_disease_id(disease_name)
+        if disease_id is None:
+            raise DataSourceError(
+                self._source_name,
+                f"No disease found for '{disease_name}'",
+            )
 
         cached = cache_get(
             "disease_synonyms", {"disease_id": disease_id}, self.cache_dir
@@ -1,10 +1,11 @@
 """
 PubMed API client.
 
-Three methods:
-  1. search         — Find PMIDs matching a query (cached)
-  2. fetch_articles — Fetch article content for given PMIDs
-  3. get_count      — Quick count of results without fetching
+Four methods:
+  1. search          — Find PMIDs matching a query (cached)
+  2. fetch_articles  — Fetch article content for given PMIDs
+  3. fetch_summaries — Fetch bibliographic fields only (esummary) for given PMIDs
+  4. get_count       — Quick count of results without fetching
 """
 
 from __future__ import annotations
@@ -17,6 +18,8 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
+import aiohttp
+
 from indication_scout.config import get_settings
 from indication_scout.constants import (
     DEFAULT_CACHE_DIR,
@@ -27,7 +30,14 @@ from indication_scout.constants import (
 )
 from indication_scout.data_sources.base_client import BaseClient, DataSourceError
 from indication_scout.utils.cache import cache_get, cache_set
-from indication_scout.models.model_pubmed_abstract import PubmedAbstract
+from indication_scout.models.model_pubmed_abstract import PubmedAbstract, PubmedSummary
+
+# Control characters invalid in XML 1.0 (U+0000–U+001F except tab, newline and
+# carriage-return). All single bytes below 0x80, so they can be stripped from
+# UTF-8 chunks without decoding them first.
+_INVALID_XML_CHARS = re.compile(rb"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Size of the body chunks fed to the efetch parser while the response streams in.
+_EFETCH_CHUNK_BYTES: int = 64 * 1024
 
 
 class PubMedClient(BaseClient):
@@ -156,22 +166,10 @@ class PubMedClient(BaseClient):
 
         Uses esummary to fetch publication dates cheaply (no abstract text).
         PubMed's maxdate filter is not strictly respected, so this is a
-        post-search guard.
+        post-search guard. Kept PMIDs stay in input order.
         """
-        if batch_size is None:
-            batch_size = get_settings().pubmed_esummary_batch_size
         kept: list[str] = []
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i : i + batch_size]
-            params: dict[str, Any] = {
-                "db": "pubmed",
-                "id": ",".join(batch),
-                "retmode": "json",
-            }
-            async with self._get_semaphore():
-                data = await self._rest_get_json_tolerant(
-                    self.SUMMARY_URL, self._inject_api_key(params)
-                )
+        for batch, data in await self._esummary(pmids, batch_size):
             result = data.get("result", {})
             for pmid in batch:
                 summary = result.get(pmid, {})
@@ -188,179 +186,295 @@ class PubMedClient(BaseClient):
                     kept.append(pmid)
         return kept
 
+    async def _esummary(
+        self, pmids: list[str], batch_size: int | None = None
+    ) -> list[tuple[list[str], dict[str, Any]]]:
+        """Run esummary over pmids in batches of pubmed_esummary_batch_size.
+
+        Batches are issued concurrently; the class-level semaphore still bounds
+        in-flight NCBI requests. Returns (batch, response) pairs in batch order.
+        """
+        if batch_size is None:
+            batch_size = get_settings().pubmed_esummary_batch_size
+        batches = [pmids[i : i + batch_size] for i in range(0, len(pmids), batch_size)]
+        responses = await asyncio.gather(
+            *[self._esummary_batch(batch) for batch in batches]
+        )
+        return list(zip(batches, responses))
+
+    async def _esummary_batch(self, batch: list[str]) -> dict[str, Any]:
+        """Run one esummary call for a batch of PMIDs."""
+        params: dict[str, Any] = {
+            "db": "pubmed",
+            "id": ",".join(batch),
+            "retmode": "json",
+        }
+        async with self._get_semaphore():
+            return await self._rest_get_json_tolerant(
+                self.SUMMARY_URL, self._inject_api_key(params)
+            )
+
     async def fetch_abstracts(
         self, pmids: list[str], batch_size: int | None = None
     ) -> list[PubmedAbstract]:
-        """Fetch article content for given PMIDs."""
+        """Fetch article content for given PMIDs.
+
+        PMIDs are split into efetch batches of pubmed_efetch_batch_size which are
+        issued concurrently; the class-level semaphore still bounds in-flight NCBI
+        requests. Results keep batch order.
+        """
         if not pmids:
             return []
 
         if batch_size is None:
             batch_size = get_settings().pubmed_efetch_batch_size
-        all_articles: list[PubmedAbstract] = []
-
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i : i + batch_size]
-            params: dict[str, Any] = {
-                "db": "pubmed",
-                "id": ",".join(batch),
-                "retmode": "xml",
-                "rettype": "abstract",
-            }
-
-            async with self._get_semaphore():
-                xml_text = await self._rest_get_xml(
-                    self.FETCH_URL, self._inject_api_key(params)
-                )
 
-            articles = self._parse_pubmed_xml(xml_text)
-            all_articles.extend(articles)
+        batches = [pmids[i : i + batch_size] for i in range(0, len(pmids), batch_size)]
+        batch_results = await asyncio.gather(
+            *[self._fetch_abstracts_batch(batch) for batch in batches]
+        )
+        return [article for articles in batch_results for article in articles]
 
-        return all_articles
+    async def _fetch_abstracts_batch(self, batch: list[str]) -> list[PubmedAbstract]:
+        """Run one efetch call for a batch of PMIDs; the XML is parsed as it arrives."""
+        params: dict[str, Any] = {
+            "db": "pubmed",
+            "id": ",".join(batch),
+            "retmode": "xml",
+            "rettype": "abstract",
+        }
 
-    def _parse_pubmed_xml(self, xml_text: str) -> list[PubmedAbstract]:
-        """Parse PubMed XML response into PubmedAbstract objects."""
-        articles = []
+        async with self._get_semaphore():
+            return await self._rest_get_streamed(
+                self.FETCH_URL, self._inject_api_key(params), self._read_efetch_stream
+            )
 
-        # Strip control characters that are invalid in XML 1.0 (U+0000–U+001F,
-        # excluding the three characters XML permits: tab, newline, carriage-return).
-        xml_text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", xml_text)
+    async def _read_efetch_stream(
+        self, resp: aiohttp.ClientResponse
+    ) -> list[PubmedAbstract]:
+        """Parse an efetch response body chunk by chunk as it is received."""
+        parser = ET.XMLPullParser(events=("end",))
+        articles: list[PubmedAbstract] = []
+        book_articles: list[PubmedAbstract] = []
+        async for chunk in resp.content.iter_chunked(_EFETCH_CHUNK_BYTES):
+            self._feed_efetch(parser, chunk, articles, book_articles)
+        self._feed_efetch(parser, None, articles, book_articles)
+        return articles + book_articles
+
+    async def fetch_summaries(
+        self, pmids: list[str], batch_size: int | None = None
+    ) -> list[PubmedSummary]:
+        """Fetch title/authors/journal/pub_date for given PMIDs via esummary.
+
+        Much smaller responses than fetch_abstracts (JSON docsums, no abstract,
+        MeSH or keywords) — use when only bibliographic fields are needed.
+        Shares the batched esummary path with _filter_pmids_by_date.
+        """
+        return [
+            summary
+            for _, data in await self._esummary(pmids, batch_size)
+            for summary in self._parse_esummary(data)
+        ]
 
+    @staticmethod
+    def _parse_esummary(data: dict[str, Any]) -> list[PubmedSummary]:
+        """Parse an esummary JSON response into PubmedSummary objects.
+
+        Follows result["uids"] order. UIDs NCBI could not resolve come back
+        with an "error" key instead of a docsum and are skipped.
+        """
+        result = data.get("result", {})
+        summaries: list[PubmedSummary] = []
+        for uid in result.get("uids", []):
+            doc = result.get(uid, {})
+            if not doc or "error" in doc:
+                continue
+            summaries.append(
+                PubmedSummary(
+                    pmid=uid,
+                    title=doc.get("title"),
+                    authors=[
+                        a["name"]
+                        for a in doc.get("authors") or []
+                        if a.get("authtype") == "Author" and a.get("name")
+                    ],
+                    journal=doc.get("fulljournalname") or None,
+                    pub_date=doc.get("pubdate") or None,
+                )
+            )
+        return summaries
+
+    def _parse_pubmed_xml(self, xml_text: str) -> list[PubmedAbstract]:
+        """Parse a complete PubMed XML response into PubmedAbstract objects.
+
+        Journal articles are returned before book articles, each in document
+        order. efetch responses take the streamed path, _read_efetch_stream.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        articles: list[PubmedAbstract] = []
+        book_articles: list[PubmedAbstract] = []
+        self._feed_efetch(parser, xml_text.encode(), articles, book_articles)
+        self._feed_efetch(parser, None, articles, book_articles)
+        return articles + book_articles
+
+    def _feed_efetch(
+        self,
+        parser: ET.XMLPullParser,
+        chunk: bytes | None,
+        articles: list[PubmedAbstract],
+        book_articles: list[PubmedAbstract],
+    ) -> None:
+        """Feed one chunk (None closes the document); convert each record it completes.
+
+        Each record is cleared once converted, so only the unfinished record's
+        subtree is held between chunks.
+        """
         try:
-            root = ET.fromstring(xml_text)
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(_INVALID_XML_CHARS.sub(b"", chunk))
+            # Syntax errors in a fed chunk surface from read_events(), not feed().
+            for _, elem in parser.read_events():
+                if elem.tag == "PubmedArticle":
+                    parsed = self._parse_article_elem(elem)
+                    if parsed is not None:
+                        articles.append(parsed)
+                    elem.clear()
+                elif elem.tag == "PubmedBookArticle":
+                    parsed = self._parse_book_article_elem(elem)
+                    if parsed is not None:
+                        book_articles.append(parsed)
+                    elem.clear()
         except ET.ParseError as e:
             raise DataSourceError(self._source_name, f"Failed to parse XML: {e}")
 
-        for article_elem in root.findall(".//PubmedArticle"):
-            pmid = self._xml_text(article_elem, ".//PMID")
-            if not pmid:
+    def _parse_article_elem(self, article_elem: ET.Element) -> PubmedAbstract | None:
+        """Convert one <PubmedArticle> element; None if it has no PMID."""
+        pmid = self._xml_text(article_elem, ".//PMID")
+        if not pmid:
+            return None
+
+        title = self._xml_text(article_elem, ".//ArticleTitle")
+
+        # Abstract - may have multiple sections
+        abstract_parts = []
+        for abs_elem in article_elem.findall(".//AbstractText"):
+            label = abs_elem.get("Label", "")
+            text = "".join(abs_elem.itertext())
+            if label:
+                abstract_parts.append(f"{label}: {text}")
+            elif text:
+                abstract_parts.append(text)
+        abstract = " ".join(abstract_parts) if abstract_parts else None
+
+        # Authors
+        authors = []
+        for author in article_elem.findall(".//Author"):
+            last_name = self._xml_text(author, "LastName")
+            fore_name = self._xml_text(author, "ForeName")
+            if last_name:
+                name = f"{last_name}, {fore_name}" if fore_name else last_name
+                authors.append(name)
+
+        journal = self._xml_text(article_elem, ".//Journal/Title")
+
+        # Publication date
+        pub_date = None
+        pub_date_elem = article_elem.find(".//PubDate")
+        if pub_date_elem is not None:
+            year = self._xml_text(pub_date_elem, "Year")
+            month = self._xml_text(pub_date_elem, "Month")
+            day = self._xml_text(pub_date_elem, "Day")
+            if year:
+                pub_date = year
+                if month:
+                    pub_date += f"-{month}"
+                    if day:
+                        pub_date += f"-{day}"
+
+        mesh_terms = [
+            self._xml_text(mesh, "DescriptorName")
+            for mesh in article_elem.findall(".//MeshHeading")
+            if self._xml_text(mesh, "DescriptorName")
+        ]
+
+        keywords = [kw.text for kw in article_elem.findall(".//Keyword") if kw.text]
+
+        return PubmedAbstract(
+            pmid=pmid,
+            title=title,
+            abstract=abstract,
+            authors=authors,
+            journal=journal,
+            pub_date=pub_date,
+            mesh_terms=mesh_terms,
+            keywords=keywords,
+        )
+
+    def _parse_book_article_elem(self, book_elem: ET.Element) -> PubmedAbstract | None:
+        """Convert one <PubmedBookArticle> element; None if it has no BookDocument/PMID."""
+        doc = book_elem.find("BookDocument")
+        if doc is None:
+            return None
+
+        pmid = self._xml_text(doc, ".//PMID")
+        if not pmid:
+            return None
+
+        title = self._xml_text(doc, ".//ArticleTitle")
+
+        # Abstract - may have multiple labelled sections
+        abstract_parts = []
+        for abs_elem in doc.findall(".//AbstractText"):
+            label = abs_elem.get("Label", "")
+            text = "".join(abs_elem.itertext())
+            if label:
+                abstract_parts.append(f"{label}: {text}")
+            elif text:
+                abstract_parts.append(text)
+        abstract = " ".join(abstract_parts) if abstract_parts else None
+
+        # Authors only — exclude editors (AuthorList Type="editors")
+        authors = []
+        for author_list in doc.findall("AuthorList"):
+            if author_list.get("Type") == "editors":
                 continue
-
-            title = self._xml_text(article_elem, ".//ArticleTitle")
-
-            # Abstract - may have multiple sections
-            abstract_parts = []
-            for abs_elem in article_elem.findall(".//AbstractText"):
-                label = abs_elem.get("Label", "")
-                text = "".join(abs_elem.itertext())
-                if label:
-                    abstract_parts.append(f"{label}: {text}")
-                elif text:
-                    abstract_parts.append(text)
-            abstract = " ".join(abstract_parts) if abstract_parts else None
-
-            # Authors
-            authors = []
-            for author in article_elem.findall(".//Author"):
+            for author in author_list.findall("Author"):
                 last_name = self._xml_text(author, "LastName")
                 fore_name = self._xml_text(author, "ForeName")
                 if last_name:
                     name = f"{last_name}, {fore_name}" if fore_name else last_name
                     authors.append(name)
 
-            journal = self._xml_text(article_elem, ".//Journal/Title")
-
-            # Publication date
-            pub_date = None
-            pub_date_elem = article_elem.find(".//PubDate")
-            if pub_date_elem is not None:
-                year = self._xml_text(pub_date_elem, "Year")
-                month = self._xml_text(pub_date_elem, "Month")
-                day = self._xml_text(pub_date_elem, "Day")
-                if year:
-                    pub_date = year
-                    if month:
-                        pub_date += f"-{month}"
-                        if day:
-                            pub_date += f"-{day}"
-
-            mesh_terms = [
-                self._xml_text(mesh, "DescriptorName")
-                for mesh in article_elem.findall(".//MeshHeading")
-                if self._xml_text(mesh, "DescriptorName")
-            ]
-
-            keywords = [kw.text for kw in article_elem.findall(".//Keyword") if kw.text]
-
-            articles.append(
-                PubmedAbstract(
-                    pmid=pmid,
-                    title=title,
-                    abstract=abstract,
-                    authors=authors,
-                    journal=journal,
-                    pub_date=pub_date,
-                    mesh_terms=mesh_terms,
-                    keywords=keywords,
-                )
-            )
-
-        for book_elem in root.findall(".//PubmedBookArticle"):
-            doc = book_elem.find("BookDocument")
-            if doc is None:
-                continue
-
-            pmid = self._xml_text(doc, ".//PMID")
-            if not pmid:
-                continue
-
-            title = self._xml_text(doc, ".//ArticleTitle")
-
-            # Abstract - may have multiple labelled sections
-            abstract_parts = []
-            for abs_elem in doc.findall(".//AbstractText"):
-                label = abs_elem.get("Label", "")
-                text = "".join(abs_elem.itertext())
-                if label:
-                    abstract_parts.append(f"{label}: {text}")
-                elif text:
-                    abstract_parts.append(text)
-            abstract = " ".join(abstract_parts) if abstract_parts else None
-
-            # Authors only — exclude editors (AuthorList Type="editors")
-            authors = []
-            for author_list in doc.findall("AuthorList"):
-                if author_list.get("Type") == "editors":
-                    continue
-                for author in author_list.findall("Author"):
-                    last_name = self._xml_text(author, "LastName")
-                    fore_name = self._xml_text(author, "ForeName")
-                    if last_name:
-                        name = f"{last_name}, {fore_name}" if fore_name else last_name
-                        authors.append(name)
-
-            journal = self._xml_text(doc, ".//Book/BookTitle")
-
-            # Publication date
-            pub_date = None
-            pub_date_elem = doc.find(".//PubDate")
-            if pub_date_elem is not None:
-                year = self._xml_text(pub_date_elem, "Year")
-                month = self._xml_text(pub_date_elem, "Month")
-                day = self._xml_text(pub_date_elem, "Day")
-                if year:
-                    pub_date = year
-                    if month:
-                        pub_date += f"-{month}"
-                        if day:
-                            pub_date += f"-{day}"
-
-            keywords = [kw.text for kw in doc.findall(".//Keyword") if kw.text]
-
-            articles.append(
-                PubmedAbstract(
-                    pmid=pmid,
-                    title=title,
-                    abstract=abstract,
-                    authors=authors,
-                    journal=journal,
-                    pub_date=pub_date,
-                    mesh_terms=[],
-                    keywords=keywords,
-                )
-            )
-
-        return articles
+        journal = self._xml_text(doc, ".//Book/BookTitle")
+
+        # Publication date
+        pub_date = None
+        pub_date_elem = doc.find(".//PubDate")
+        if pub_date_elem is not None:
+            year = self._xml_text(pub_date_elem, "Year")
+            month = self._xml_text(pub_date_elem, "Month")
+            day = self._xml_text(pub_date_elem, "Day")
+            if year:
+                pub_date = year
+                if month:
+                    pub_date += f"-{month}"
+                    if day:
+                        pub_date += f"-{day}"
+
+        keywords = [kw.text for kw in doc.findall(".//Keyword") if kw.text]
+
+        return PubmedAbstract(
+            pmid=pmid,
+            title=title,
+            abstract=abstract,
+            authors=authors,
+            journal=journal,
+            pub_date=pub_date,
+            mesh_terms=[],
+            keywords=keywords,
+        )
 
     @staticmethod
     def _xml_text(elem: ET.Element, path: str) -> str | None:
@@ -7,13 +7,13 @@ mesh terms for the same drug). The drug name is preserved for grouped CV.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
 
 from indication_scout.constants import DEFAULT_CACHE_DIR
 from indication_scout.models.model_clinical_trials import Trial
+from indication_scout.utils.cache import decode_entry
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ def _load_dir(cache_dir: Path, namespace: str, label: int) -> list[LabeledTrial]
 
     seen: dict[str, LabeledTrial] = {}
     for fp in ns_dir.glob("*.json"):
-        entry = json.loads(fp.read_text())
+        entry = decode_entry(fp.read_bytes())
         drug = entry.get("params", {}).get("drug", "")
         for raw in entry.get("data", {}).get("trials", []):
             try:
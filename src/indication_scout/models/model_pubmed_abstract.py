@@ -22,3 +22,25 @@ class PubmedAbstract(BaseModel):
             if values.get(field_name) is None and field_info.default is not None:
                 values[field_name] = field_info.default
         return values
+
+
+class PubmedSummary(BaseModel):
+    """Bibliographic fields for a PubMed article from esummary (no abstract text).
+
+    Authors are in esummary's "Lastname Initials" form (e.g. "Marso SP"),
+    not the "Lastname, Forename" form PubmedAbstract gets from efetch.
+    """
+
+    pmid: str = ""
+    title: str = ""
+    authors: list[str] = []
+    journal: str | None = None
+    pub_date: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def coerce_nones(cls, values: dict) -> dict:
+        for field_name, field_info in cls.model_fields.items():
+            if values.get(field_name) is None and field_info.default is not None:
+                values[field_name] = field_info.default
+        return values
@@ -224,7 +224,9 @@ async def normalize_for_pubmed(raw_term: str, drug_name: str | None = None) -> s
     normalized_terms = {t.strip().lower() for t in normalized.split("OR")}
     if normalized_terms <= BROADENING_BLOCKLIST:
         logger.info(
-            f"Rejected over-broad normalization '{normalized}' for '{raw_term}', keeping raw term"
+            "Rejected over-broad normalization '%s' for '%s', keeping raw term",
+            normalized,
+            raw_term,
         )
         normalized = raw_term
 
@@ -240,14 +242,14 @@ async def normalize_for_pubmed(raw_term: str, drug_name: str | None = None) -> s
             broader_terms = {t.strip().lower() for t in broader.split("OR")}
             if broader_terms & BROADENING_BLOCKLIST:
                 logger.info(
-                    f"Rejected over-broad fallback '{broader}' for '{normalized}'"
+                    "Rejected over-broad fallback '%s' for '%s'", broader, normalized
                 )
             else:
                 broader_count = await pubmed_count(f"{drug_name} AND ({broader})")
                 if broader_count >= MIN_RESULTS:
                     normalized = broader
 
-    logger.info(f"Normalized '{raw_term}' → '{normalized}'")
+    logger.info("Normalized '%s' → '%s'", raw_term, normalized)
 
     return normalized
 
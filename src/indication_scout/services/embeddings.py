@@ -11,6 +11,15 @@ rather than just keyword matches.
 
 The model is lazy-loaded on first call to embed() and reused for the lifetime
 of the process — loading takes ~10s and uses ~500MB RAM, so we only do it once.
+
+On CPU-only hosts, EMBEDDING_BACKEND=onnx runs the model through ONNX Runtime.
+An int8 dynamically quantized export can be produced once with
+sentence_transformers.backend.export_dynamic_quantized_onnx_model and selected
+via EMBEDDING_ONNX_FILE. Quantized vectors differ slightly from FP32 ones, so
+re-embed stored abstracts when switching backends.
+
+On CUDA hosts, EMBEDDING_FP16=true runs the torch backend in half precision.
+It is never switched on implicitly, for the same reason: re-embed when changing it.
 """
 
 import asyncio
@@ -40,17 +49,49 @@ def _get_model() -> SentenceTransformer:
     """
     global _model
     if _model is None:
-        model_name = get_settings().embedding_model
-        logger.info("Loading embedding model %s", model_name)
-        _model = SentenceTransformer(model_name, local_files_only=True)
+        settings = get_settings()
+        model_name = settings.embedding_model
+        logger.info(
+            "Loading embedding model %s (%s backend)",
+            model_name,
+            settings.embedding_backend,
+        )
+        if settings.embedding_backend == "onnx":
+            # CPU path: ONNX Runtime, optionally on an int8 dynamically quantized
+            # export (see embedding_onnx_file). Needs the [onnx] extra.
+            model_kwargs = (
+                {"file_name": settings.embedding_onnx_file}
+                if settings.embedding_onnx_file
+                else None
+            )
+            _model = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs=model_kwargs,
+                local_files_only=True,
+            )
+        else:
+            # SentenceTransformer picks CUDA automatically when available.
+            model = SentenceTransformer(model_name, local_files_only=True)
+            if settings.embedding_fp16:
+                # FP16 forward pass so the matmuls use tensor cores; encode() still
+                # hands back plain floats, which pgvector stores as float32.
+                if model.device.type != "cuda":
+                    raise ValueError(
+                        "EMBEDDING_FP16 requires a CUDA device for the torch backend"
+                    )
+                model.half()
+            _model = model
+        logger.info("Embedding model on %s", _model.device)
     return _model
 
 
 def embed(texts: list[str]) -> list[list[float]]:
     """Embed a list of texts using BioLORD-2023.
 
-    All texts are encoded in a single batch — callers should pass the full
-    list rather than calling this in a loop, to avoid redundant model overhead.
+    All texts go through one encode() call, which tokenizes and runs the forward
+    pass in chunks of embedding_batch_size — callers should pass the full list
+    rather than calling this in a loop, to avoid redundant model overhead.
 
     Args:
         texts: Texts to embed. For abstracts, use "<title>. <abstract text>".
@@ -58,14 +99,22 @@ def embed(texts: list[str]) -> list[list[float]]:
                (e.g. "Evidence for metformin as a treatment for colorectal cancer...").
 
     Returns:
-        List of 768-dimensional embedding vectors, one per input text,
-        in the same order as the input.
+        List of 768-dimensional unit-length (L2-normalized) embedding vectors,
+        one per input text, in the same order as the input.
     """
     model = _get_model()
-    # convert_to_numpy=True returns an ndarray; we convert to plain Python
-    # floats so the vectors can be stored directly via SQLAlchemy/pgvector.
-    vectors = model.encode(texts, convert_to_numpy=True)
-    return [v.tolist() for v in vectors]
+    # convert_to_numpy=True returns an (N, 768) ndarray; a single .tolist() on
+    # the matrix converts it to plain Python floats in C, so the vectors can be
+    # stored directly via SQLAlchemy/pgvector. Unit vectors let semantic_search
+    # rank by inner product instead of full cosine distance.
+    vectors = model.encode(
+        texts,
+        batch_size=get_settings().embedding_batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    return vectors.tolist()
 
 
 async def embed_async(texts: list[str]) -> list[list[float]]:
@@ -2,6 +2,8 @@
 
 import asyncio
 import calendar
+import hashlib
+import heapq
 import json
 import logging
 from datetime import date
@@ -10,7 +12,8 @@ from pathlib import Path
 import wandb
 from pydantic import BaseModel
 
-from sqlalchemy import text
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import bindparam, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from typing_extensions import deprecated
@@ -157,10 +160,13 @@ class RetrievalService:
             if combined:
                 top_40[canonical_lower] = combined
 
-        sorted_data = dict(
-            sorted(top_40.items(), key=lambda item: len(item[1]), reverse=True)
+        top_15 = dict(
+            heapq.nlargest(
+                _settings.literature_top_k,
+                top_40.items(),
+                key=lambda item: len(item[1]),
+            )
         )
-        top_15 = dict(list(sorted_data.items())[:_settings.literature_top_k])
         logger.warning("[COMP] final top_15: %s", list(top_15.keys()))
 
         cache_set(
@@ -186,13 +192,19 @@ class RetrievalService:
         async with OpenTargetsClient(cache_dir=self.cache_dir) as open_targets_client:
             rich = await open_targets_client.get_rich_drug_data(chembl_id)
 
+        # ATC codes only come back with the Open Targets drug node, so that call has
+        # to finish first; the per-code ChEMBL lookups are independent of each other.
         atc_descriptions = []
         if rich.drug.atc_classifications:
             async with ChEMBLClient() as chembl_client:
-                for code in rich.drug.atc_classifications:
-                    atc_descriptions.append(
-                        await chembl_client.get_atc_description(code)
+                atc_descriptions = list(
+                    await asyncio.gather(
+                        *[
+                            chembl_client.get_atc_description(code)
+                            for code in rich.drug.atc_classifications
+                        ]
                     )
+                )
 
         return DrugProfile.from_rich_drug_data(rich, atc_descriptions)
 
@@ -279,6 +291,11 @@ class RetrievalService:
         Uses INSERT ... ON CONFLICT DO NOTHING so re-running with already-stored
         PMIDs is safe and idempotent. Does nothing when pairs is empty.
 
+        Rows are passed as executemany parameters rather than baked into one
+        multi-VALUES statement: the compiled INSERT is cached across calls, and
+        SQLAlchemy's insertmanyvalues still sends them in batched multi-row pages,
+        which keeps large batches under Postgres's bind-parameter limit.
+
         Args:
             pairs: Output of embed_abstracts — (PubmedAbstract, vector) tuples.
             db: Active SQLAlchemy session.
@@ -300,12 +317,8 @@ class RetrievalService:
             for abstract, vector in pairs
         ]
 
-        stmt = (
-            insert(PubmedAbstracts)
-            .values(rows)
-            .on_conflict_do_nothing(index_elements=["pmid"])
-        )
-        db.execute(stmt)
+        stmt = insert(PubmedAbstracts).on_conflict_do_nothing(index_elements=["pmid"])
+        db.execute(stmt, rows)
         db.commit()
         logger.debug("Inserted %d abstracts into pubmed_abstracts", len(rows))
 
@@ -537,22 +550,48 @@ class RetrievalService:
             "including clinical trials, efficacy data, mechanism of action, "
             "and preclinical studies"
         )
-        query_vector = (await embed_async([query_string]))[0]
+        # The query embedding is cached per query string, model and precision, so a
+        # re-run whose abstracts are all stored already never has to load BioLORD.
+        embed_params = {
+            "query": query_string,
+            "model": _settings.embedding_model,
+            "backend": _settings.embedding_backend,
+            "onnx_file": _settings.embedding_onnx_file,
+            "fp16": _settings.embedding_fp16,
+            "normalized": True,
+        }
+        query_vector = cache_get("query_embedding", embed_params, self.cache_dir)
+        if query_vector is None:
+            query_vector = (await embed_async([query_string]))[0]
+            cache_set(
+                "query_embedding",
+                embed_params,
+                query_vector,
+                self.cache_dir,
+                ttl=CACHE_TTL,
+            )
 
+        # Exact ranking over the PK-filtered candidate set. The PMID list is
+        # small (one search's worth), so an ANN index (HNSW/IVFFlat) would not help:
+        # pgvector applies WHERE after the index scan, which can return fewer than
+        # top_k rows. The query vector is bound through pgvector's Vector type.
+        # Stored and query vectors are unit length (embed() normalizes), so cosine
+        # similarity is just the inner product; <#> returns its negation and skips
+        # the two norm computations <=> does per row.
         rows = db.execute(
             text("""
                 SELECT pmid, title, abstract, similarity
                 FROM (
                     SELECT pmid, title, abstract,
-                           1 - (embedding <=> CAST(:query_vec AS vector)) AS similarity
+                           -(embedding <#> CAST(:query_vec AS vector)) AS similarity
                     FROM pubmed_abstracts
                     WHERE pmid = ANY(:pmids)
                 ) sub
                 ORDER BY similarity DESC
                 LIMIT :top_k
-            """),
+            """).bindparams(bindparam("query_vec", type_=Vector(768))),
             {
-                "query_vec": "[" + ",".join(str(x) for x in query_vector) + "]",
+                "query_vec": query_vector,
                 "pmids": pmids,
                 "top_k": _settings.semantic_search_top_k,
             },
@@ -651,8 +690,13 @@ class RetrievalService:
         return summary
 
     async def extract_organ_term(self, disease_name: str) -> str:
-        """Return the primary organ or tissue for a disease name via a small LLM call."""
-        cached = cache_get("organ_term", {"disease_name": disease_name}, self.cache_dir)
+        """Return the primary organ or tissue for a disease name via a small LLM call.
+
+        Cached under the lowercased, stripped name so case/whitespace variants of the
+        same disease share one LLM result.
+        """
+        cache_params = {"disease_name": disease_name.strip().lower()}
+        cached = cache_get("organ_term", cache_params, self.cache_dir)
         if cached is not None:
             # logger.debug("Cache hit for organ_term: %s", disease_name)
             return cached
@@ -664,7 +708,7 @@ class RetrievalService:
 
         cache_set(
             "organ_term",
-            {"disease_name": disease_name},
+            cache_params,
             organ_term,
             self.cache_dir,
             ttl=CACHE_TTL,
@@ -711,11 +755,17 @@ class RetrievalService:
             ...     "GLP1R liver inflammation",
             ... ]
         """
-        cached = cache_get(
-            "expand_search_terms",
-            {"chembl_id": chembl_id, "disease_name": disease_name},
-            self.cache_dir,
-        )
+        # Keyed on the normalized disease name and a digest of the profile, so casing
+        # variants share one LLM call and a changed profile (new targets, ATC codes)
+        # is not served a stale query set.
+        cache_params = {
+            "chembl_id": chembl_id,
+            "disease_name": disease_name.strip().lower(),
+            "drug_profile": hashlib.blake2b(
+                drug_profile.model_dump_json().encode(), digest_size=16
+            ).hexdigest(),
+        }
+        cached = cache_get("expand_search_terms", cache_params, self.cache_dir)
         if cached is not None:
             # logger.debug(
             #     "Cache hit for expand_search_terms: %s / %s", chembl_id, disease_name
@@ -753,7 +803,7 @@ class RetrievalService:
 
         cache_set(
             "expand_search_terms",
-            {"chembl_id": chembl_id, "disease_name": disease_name},
+            cache_params,
             deduped,
             self.cache_dir,
             ttl=CACHE_TTL,
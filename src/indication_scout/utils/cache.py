@@ -2,25 +2,61 @@
 Shared file-based cache utility.
 
 Used by data source clients and services to avoid redundant network/LLM calls.
-Cache entries are JSON files keyed by a SHA-256 hash of (namespace, params).
+Cache entries are JSON files keyed by a 128-bit BLAKE2b hash of (namespace, params).
+Entry bodies are (de)serialised with orjson, which reads and writes bytes directly; some cached
+payloads (OT target data, competitor maps) run to megabytes. Entries above ZSTD_MIN_BYTES are
+stored zstd-compressed and recognised on read by the zstd frame magic; smaller entries stay
+plain JSON so they remain readable on disk.
+
+Expiry is enforced lazily on read. cache_prune() sweeps a cache dir for entries that will never be
+read again (expired, corrupt, or keyed under the old SHA-256 scheme) and can evict least-recently
+used entries down to a byte budget. The ClinicalTrials completed/terminated namespaces are never
+pruned: trial_risk reads every file in them as its labeled training corpus.
 """
 
 import hashlib
-import json
 import logging
+import os
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+import zstandard
+
 from indication_scout.constants import CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
+# Serialised entries at or above this size are written zstd-compressed.
+ZSTD_MIN_BYTES: int = 64 * 1024
+_ZSTD_LEVEL: int = 3
+_ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+
+# File stems written by cache_set: 32-hex BLAKE2b keys, or 64-hex SHA-256 keys from before the
+# switch (no longer addressable). Anything else under cache_dir is owned by another module.
+_KEY_STEM_RE = re.compile(r"[0-9a-f]{32}|[0-9a-f]{64}")
+
+# Namespaces cache_prune leaves alone. trial_risk.data builds its training set from every entry in
+# these, regardless of TTL or key scheme, so they act as a persistent store rather than a cache.
+_PRUNE_EXEMPT_NAMESPACES: frozenset[str] = frozenset({"ct_completed", "ct_terminated"})
+
 
 def cache_key(namespace: str, params: dict[str, Any]) -> str:
-    """Return a deterministic hex digest for the given namespace and params."""
-    raw = json.dumps({"ns": namespace, **params}, sort_keys=True, default=str)
-    return hashlib.sha256(raw.encode()).hexdigest()
+    """Return a deterministic hex digest for the given namespace and params.
+
+    Keys only need to avoid collisions between cache entries, not resist attack; a 16-byte BLAKE2b
+    digest (32 hex chars) is cheaper to compute than SHA-256 and collisions stay negligible at
+    cache scale.
+    """
+    raw = orjson.dumps(
+        {"ns": namespace, **params},
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 def cache_get(
@@ -30,22 +66,39 @@ def cache_get(
 ) -> Any | None:
     """Return cached data if present and unexpired, otherwise None."""
     path = cache_dir / namespace / f"{cache_key(namespace, params)}.json"
-    if not path.exists():
+    # Open directly rather than exists() + read: one lookup instead of two on the hit path.
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return None
     try:
-        entry = json.loads(path.read_text())
-        age = (
-            datetime.now() - datetime.fromisoformat(entry["cached_at"])
-        ).total_seconds()
-        if age > entry.get("ttl", CACHE_TTL):
+        entry = decode_entry(raw)
+        if _is_expired(entry):
             path.unlink(missing_ok=True)
             return None
         return entry["data"]
-    except (json.JSONDecodeError, KeyError, ValueError):
+    except (orjson.JSONDecodeError, zstandard.ZstdError, KeyError, ValueError):
         path.unlink(missing_ok=True)
         return None
 
 
+def decode_entry(raw: bytes) -> dict[str, Any]:
+    """Parse an entry file's bytes, decompressing zstd frames first.
+
+    Public for modules that walk a namespace directory directly (trial_risk.data) instead of
+    going through cache_get; entries of ZSTD_MIN_BYTES or more are not plain JSON on disk.
+    """
+    if raw[:4] == _ZSTD_MAGIC:
+        raw = zstandard.decompress(raw)
+    return orjson.loads(raw)
+
+
+def _is_expired(entry: dict[str, Any]) -> bool:
+    """True if the entry is older than its TTL. Raises KeyError/ValueError on a malformed entry."""
+    age = (datetime.now() - datetime.fromisoformat(entry["cached_at"])).total_seconds()
+    return age > entry.get("ttl", CACHE_TTL)
+
+
 def cache_set(
     namespace: str,
     params: dict[str, Any],
@@ -53,7 +106,12 @@ def cache_set(
     cache_dir: Path,
     ttl: int | None = None,
 ) -> None:
-    """Write data to the cache under the given namespace and params."""
+    """Write data to the cache under the given namespace and params.
+
+    The body goes to a temp file in the namespace dir and is os.replace()d into place, so a
+    concurrent cache_get (clients read and write from asyncio.to_thread workers) sees either the
+    old entry or the new one, never a partial file it would discard as corrupt.
+    """
     ns_dir = cache_dir / namespace
     ns_dir.mkdir(parents=True, exist_ok=True)
     entry = {
@@ -63,6 +121,57 @@ def cache_set(
         "cached_at": datetime.now().isoformat(),
         "ttl": ttl if ttl is not None else CACHE_TTL,
     }
-    (ns_dir / f"{cache_key(namespace, params)}.json").write_text(
-        json.dumps(entry, default=str)
-    )
+    body = orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS)
+    if len(body) >= ZSTD_MIN_BYTES:
+        body = zstandard.compress(body, _ZSTD_LEVEL)
+    fd, tmp_name = tempfile.mkstemp(dir=ns_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp_name, ns_dir / f"{cache_key(namespace, params)}.json")
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def cache_prune(cache_dir: Path, max_bytes: int | None = None) -> int:
+    """Delete cache_set entries that can no longer be served, then enforce a size budget.
+
+    Removes entries that are expired, unparseable, or stored under a legacy SHA-256 key. If
+    max_bytes is given and the surviving entries still exceed it, the least recently used ones
+    (by file atime, falling back to mtime where the filesystem does not track reads) are removed
+    until they fit. Files not written by cache_set, and anything under _PRUNE_EXEMPT_NAMESPACES,
+    are never touched.
+
+    Returns the number of files removed.
+    """
+    removed = 0
+    survivors: list[tuple[float, int, Path]] = []
+    for path in cache_dir.glob("*/*.json"):
+        if path.parent.name in _PRUNE_EXEMPT_NAMESPACES or not _KEY_STEM_RE.fullmatch(path.stem):
+            continue
+        try:
+            # stat before reading: the expiry check itself would otherwise bump atime.
+            stat = path.stat()
+            stale = len(path.stem) == 64 or _is_expired(decode_entry(path.read_bytes()))
+        except FileNotFoundError:
+            continue
+        except (orjson.JSONDecodeError, zstandard.ZstdError, KeyError, ValueError):
+            stale = True
+        if stale:
+            path.unlink(missing_ok=True)
+            removed += 1
+        else:
+            survivors.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+
+    if max_bytes is not None:
+        total = sum(size for _, size, _ in survivors)
+        for _, size, path in sorted(survivors, key=lambda s: s[0]):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+    logger.info("cache_prune: removed %d entries from %s", removed, cache_dir)
+    return removed
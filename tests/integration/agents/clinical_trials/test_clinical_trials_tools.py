@@ -122,9 +122,9 @@ async def test_search_trials_tool_respects_date_before_cutoff():
 
     # At least one Phase 3 trial must survive the cutoff — the dupilumab
     # eosinophilic esophagitis approval was supported by Phase 3 trials that
-    # started before 2022-05-20.
-    phase_3_trials = [t for t in result.trials if "Phase 3" in t.phase]
-    assert len(phase_3_trials) >= 1, (
+    # started before 2022-05-20. Substring match so combined phases such as
+    # "Phase 2/Phase 3" count.
+    assert any("Phase 3" in t.phase for t in result.trials), (
         "expected at least one Phase 3 dupilumab × eosinophilic esophagitis "
         f"trial with start_date < {cutoff_iso}; got phases "
         f"{[t.phase for t in result.trials]}"
@@ -8,6 +8,7 @@ Hits real Anthropic, PubMed, Open Targets, and ChEMBL APIs.
 Uses the test database (scout_test) via db_session_truncating.
 """
 
+import asyncio
 import itertools
 import logging
 from datetime import date
@@ -394,11 +395,19 @@ async def test_fetch_and_cache_cutoff_shift_narrows_result_set(
     early_set = set(early_pmids)
     late_set = set(late_pmids)
 
-    # Each result must respect its own cutoff (re-run the production filter).
+    # Re-run the production filter for every (pmids, cutoff) pair the asserts
+    # below need. The three lookups are independent, so issue them together.
     async with PubMedClient(cache_dir=test_cache_dir) as client:
-        early_kept = set(await client._filter_pmids_by_date(early_pmids, _EARLY_CUTOFF))
-        late_kept = set(await client._filter_pmids_by_date(late_pmids, _LATE_CUTOFF))
+        early_kept, late_kept, late_under_early = (
+            set(kept)
+            for kept in await asyncio.gather(
+                client._filter_pmids_by_date(early_pmids, _EARLY_CUTOFF),
+                client._filter_pmids_by_date(late_pmids, _LATE_CUTOFF),
+                client._filter_pmids_by_date(late_pmids, _EARLY_CUTOFF),
+            )
+        )
 
+    # Each result must respect its own cutoff.
     early_leaked = sorted(early_set - early_kept)
     late_leaked = sorted(late_set - late_kept)
     assert not early_leaked, (
@@ -415,10 +424,6 @@ async def test_fetch_and_cache_cutoff_shift_narrows_result_set(
     # the early run could not. Verify by re-filtering the late set against
     # the EARLY cutoff: anything that survives the late filter but NOT the
     # early one is a paper published in the window between the two cutoffs.
-    async with PubMedClient(cache_dir=test_cache_dir) as client:
-        late_under_early = set(
-            await client._filter_pmids_by_date(late_pmids, _EARLY_CUTOFF)
-        )
     in_window = late_set - late_under_early
     assert in_window, (
         f"{_LATE_CUTOFF} cutoff returned no PMIDs in the window "
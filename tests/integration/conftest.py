@@ -1,6 +1,13 @@
 """Shared fixtures for integration tests."""
 
+import asyncio
+import functools
+import logging
 import os
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any
 
 # Swap to the integration constants file before any indication_scout import
 # below — get_settings() is @lru_cache'd, so the first import freezes whichever
@@ -11,10 +18,40 @@ if os.environ.get("CONSTANTS_FILE") in (None, ".env.constants.test"):
     os.environ["CONSTANTS_FILE"] = ".env.constants.integration"
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+try:
+    import uvloop
+except ImportError:  # not built for Windows; fall back to the stock loop
+    uvloop = None
+
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_asyncio_loop_factories(config, item) -> dict[str, Callable[[], Any]]:
+    """Run integration tests on uvloop: they are network-bound, and libuv's loop
+    has lower per-await and per-socket overhead than the stock selector loop.
+    Where uvloop is unavailable (Windows), use the default asyncio loop."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Mark every integration test slow.
+
+    Each one reaches a live API (NCBI, Open Targets, ClinicalTrials.gov, ChEMBL,
+    openFDA), an LLM, Postgres or BioLORD, or replays a cassette recorded from
+    one, so `-m "not slow"` leaves exactly the unit suite.
+    """
+    for item in items:
+        if item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(pytest.mark.slow)
+
 
 @pytest.fixture(autouse=True, scope="session")
 def load_env() -> None:
@@ -29,6 +66,113 @@ from indication_scout.data_sources.clinical_trials import ClinicalTrialsClient
 from indication_scout.data_sources.fda import FDAClient
 from indication_scout.data_sources.open_targets import OpenTargetsClient
 from indication_scout.data_sources.pubmed import PubMedClient
+from indication_scout.services.disease_helper import normalize_for_pubmed
+from indication_scout.services.pubmed_query import get_pubmed_query
+from indication_scout.utils.cache import cache_get, cache_set
+
+logger = logging.getLogger(__name__)
+
+# Opt-in memoization of LLM-backed helpers across test sessions. Off by default
+# so a normal run still exercises the live prompt; set
+# INDICATION_SCOUT_TEST_CACHE=1 for a fast local loop.
+_TEST_LLM_MEMO_ENV: str = "INDICATION_SCOUT_TEST_CACHE"
+_TEST_LLM_MEMO_TTL: int = 30 * 86400  # 30 days in seconds
+
+
+def _memoize_llm_helper(
+    fn: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap an async LLM-backed helper with a TEST_CACHE_DIR-backed memo.
+
+    Keyed on (function name, args, kwargs) via the shared cache utility.
+    Returns fn unchanged unless INDICATION_SCOUT_TEST_CACHE=1.
+    """
+    if os.environ.get(_TEST_LLM_MEMO_ENV) != "1":
+        return fn
+
+    namespace = f"test_memo_{fn.__name__}"
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        params = {"args": list(args), "kwargs": kwargs}
+        cached = cache_get(namespace, params, TEST_CACHE_DIR)
+        if cached is not None:
+            return cached
+        result = await fn(*args, **kwargs)
+        cache_set(namespace, params, result, TEST_CACHE_DIR, ttl=_TEST_LLM_MEMO_TTL)
+        return result
+
+    return wrapper
+
+
+@pytest.fixture(scope="session")
+def cached_normalize_for_pubmed() -> Callable[..., Awaitable[str]]:
+    """normalize_for_pubmed, memoized across sessions when INDICATION_SCOUT_TEST_CACHE=1."""
+    return _memoize_llm_helper(normalize_for_pubmed)
+
+
+@pytest.fixture(scope="session")
+def cached_get_pubmed_query() -> Callable[..., Awaitable[list[str]]]:
+    """get_pubmed_query, memoized across sessions when INDICATION_SCOUT_TEST_CACHE=1."""
+    return _memoize_llm_helper(get_pubmed_query)
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    """VCR settings for tests marked @pytest.mark.vcr (pytest-recording).
+
+    Credentials are scrubbed from recorded cassettes. Body is part of the match
+    so LLM POSTs with different prompts replay their own responses.
+    """
+    return {
+        "filter_query_parameters": ["api_key", "tool", "email"],
+        "filter_headers": ["authorization", "x-api-key"],
+        "match_on": ["method", "scheme", "host", "path", "query", "body"],
+    }
+
+
+@pytest.fixture(scope="session")
+def record_mode(pytestconfig) -> str:
+    """Record missing cassettes on first run, replay afterwards.
+
+    pytest-recording defaults to "none", which fails any test without a
+    cassette. Pass --record-mode=rewrite to refresh recorded responses.
+    """
+    return pytestconfig.getoption("--record-mode") or "once"
+
+
+@pytest.fixture(scope="module")
+def module_cassette(
+    request, vcr_config, record_mode
+) -> Callable[[str], AbstractContextManager]:
+    """Cassette factory for module-scoped prefetch fixtures.
+
+    pytest.mark.vcr only wraps the test call itself, so requests made while a
+    module fixture is set up would otherwise always go to the live API. Use as
+    `with module_cassette("name"):`; cassettes land next to the per-test ones
+    in cassettes/<module>/<name>.yaml.
+    """
+    import vcr
+
+    recorder = vcr.VCR(
+        cassette_library_dir=str(request.path.parent / "cassettes" / request.path.stem),
+        path_transformer=vcr.VCR.ensure_suffix(".yaml"),
+        record_mode=record_mode,
+        **vcr_config,
+    )
+    return recorder.use_cassette
+
+
+@pytest.fixture(scope="session")
+def biolord_model():
+    """Load BioLORD-2023 once per session.
+
+    Goes through _get_model() so the module singleton is populated too —
+    later embed()/embed_async() calls from retrieval tests reuse it.
+    """
+    from indication_scout.services.embeddings import _get_model
+
+    return _get_model()
 
 
 @pytest.fixture()
@@ -92,41 +236,63 @@ def test_cache_dir():
     return TEST_CACHE_DIR
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def fda_client():
-    """Create and tear down an FDAClient using the test cache."""
+    """Create one FDAClient on the test cache for the whole session.
+
+    Same keep-alive rationale as pubmed_client.
+    """
     c = FDAClient(cache_dir=TEST_CACHE_DIR)
     yield c
     await c.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def chembl_client():
-    """Create and tear down a ChEMBLClient."""
-    c = ChEMBLClient()
+    """Create one ChEMBLClient for the whole session and close it at teardown.
+
+    Same keep-alive rationale as pubmed_client.
+    """
+    c = ChEMBLClient(cache_dir=TEST_CACHE_DIR)
     yield c
     await c.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def open_targets_client():
-    """Create and tear down an OpenTargetsClient using the test cache."""
+    """Create one OpenTargetsClient on the test cache for the whole session.
+
+    Same keep-alive rationale as pubmed_client.
+    """
     c = OpenTargetsClient(cache_dir=TEST_CACHE_DIR)
     yield c
     await c.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def pubmed_client():
-    """Create and tear down a PubMedClient."""
+    """Create one PubMedClient for the whole session and close it at teardown.
+
+    Sharing the client keeps a single aiohttp session (and its keep-alive
+    connections to eutils) instead of a DNS lookup + TLS handshake per test.
+    The session is bound to the session event loop, which pytest.ini makes the
+    default loop for every test.
+    """
     c = PubMedClient()
+    if not c._api_key:
+        logger.warning(
+            "NCBI_API_KEY not set — PubMed integration tests are limited to 3 req/s"
+        )
     yield c
     await c.close()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def clinical_trials_client():
-    """Create and tear down a ClinicalTrialsClient."""
+    """Create one ClinicalTrialsClient for the whole session and close it at teardown.
+
+    Same keep-alive rationale as pubmed_client.
+    """
     c = ClinicalTrialsClient()
     yield c
     await c.close()
@@ -1,8 +1,11 @@
 """Integration tests for base_client module."""
 
+import asyncio
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 
 from indication_scout.constants import OPEN_TARGETS_BASE_URL
 from indication_scout.data_sources.base_client import BaseClient, DataSourceError
@@ -27,30 +30,66 @@ class ConcreteTestClient(BaseClient):
 # --- BaseClient integration tests (requires network) ---
 
 
-async def test_get_request_to_httpbin():
-    """Test GET request to a real endpoint."""
-    async with _make_client(timeout=30.0) as client:
-        result = await client._rest_get(
-            "https://httpbin.org/get",
-            params={"test_param": "test_value"},
+async def _httpbin_timeout() -> Any:
+    async with _make_client(timeout=0.001, max_retries=0) as client:
+        return await client._rest_get(
+            "https://httpbin.org/delay/10",  # 10 second delay
+            params={},
         )
 
-        assert result is not None
-        assert result["args"]["test_param"] == "test_value"
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def httpbin_results(module_cassette) -> dict[str, Any]:
+    """Issue every httpbin request these tests need concurrently, once per module.
 
-async def test_post_request_to_httpbin():
-    """Test POST request to a real endpoint."""
+    Values are the parsed responses, or the raised exception for calls expected to fail.
+    The GET and POST replay from a cassette; the timeout call never gets a response to
+    record, so it runs after the cassette is closed.
+    """
     async with _make_client(timeout=30.0) as client:
-        result = await client._request(
-            "POST",
-            "https://httpbin.org/post",
-            json_body={"key": "value"},
-            headers={"Content-Type": "application/json"},
-        )
+        with module_cassette("httpbin_results"):
+            get, post = await asyncio.gather(
+                client._rest_get(
+                    "https://httpbin.org/get",
+                    params={"test_param": "test_value"},
+                ),
+                client._request(
+                    "POST",
+                    "https://httpbin.org/post",
+                    json_body={"key": "value"},
+                    headers={"Content-Type": "application/json"},
+                ),
+                return_exceptions=True,
+            )
+    try:
+        timeout = await _httpbin_timeout()
+    except Exception as e:
+        timeout = e
+    return {"get": get, "post": post, "timeout": timeout}
+
+
+def _ok(httpbin_results: dict[str, Any], key: str) -> Any:
+    """Return a prefetched response, re-raising it if the request failed."""
+    result = httpbin_results[key]
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
-        assert result is not None
-        assert result["json"]["key"] == "value"
+
+async def test_get_request_to_httpbin(httpbin_results):
+    """Test GET request to a real endpoint."""
+    result = _ok(httpbin_results, "get")
+
+    assert result is not None
+    assert result["args"]["test_param"] == "test_value"
+
+
+async def test_post_request_to_httpbin(httpbin_results):
+    """Test POST request to a real endpoint."""
+    result = _ok(httpbin_results, "post")
+
+    assert result is not None
+    assert result["json"]["key"] == "value"
 
 
 async def test_graphql_successful_query():
@@ -111,11 +150,6 @@ async def test_rest_get_xml_returns_xml_string():
         assert "33914610" in result
 
 
-async def test_timeout_raises_error():
+async def test_timeout_raises_error(httpbin_results):
     """Test that timeouts raise DataSourceError."""
-    async with _make_client(timeout=0.001, max_retries=0) as client:
-        with pytest.raises(DataSourceError):
-            await client._rest_get(
-                "https://httpbin.org/delay/10",  # 10 second delay
-                params={},
-            )
+    assert isinstance(httpbin_results["timeout"], DataSourceError)
@@ -1,19 +1,41 @@
 """Integration tests for ChEMBLClient — hits the live ChEMBL API."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
+from indication_scout.constants import TEST_CACHE_DIR
+from indication_scout.data_sources.chembl import ChEMBLClient
 from indication_scout.models.model_chembl import ATCDescription, MoleculeData, MoleculeSynonym
 
+# Replay ChEMBL responses from tests/integration/data_sources/cassettes/ once recorded.
+pytestmark = pytest.mark.vcr
+
+_MOLECULE_CASES = [
+    ("CHEMBL894", ["N06AX12"], "Small molecule", "4.0", 1, 1985, True, "bupropion", "CHEMBL894"),
+    ("CHEMBL2108724", ["A10BJ06"], "Protein", "4.0", 1, 2017, True, "semaglutide", "CHEMBL2108724"),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def molecules_by_id(module_cassette) -> dict[str, MoleculeData]:
+    """Fetch every molecule in _MOLECULE_CASES concurrently, once per module."""
+    chembl_ids = [case[0] for case in _MOLECULE_CASES]
+    async with ChEMBLClient(cache_dir=TEST_CACHE_DIR) as client:
+        with module_cassette("molecules_by_id"):
+            molecules = await asyncio.gather(
+                *(client.get_molecule(c) for c in chembl_ids)
+            )
+    return dict(zip(chembl_ids, molecules))
+
 
 @pytest.mark.parametrize(
     "chembl_id, expected_atc, expected_type, expected_max_phase, expected_black_box, expected_first_approval, expected_oral, expected_pref_name, expected_parent_chembl_id",
-    [
-        ("CHEMBL894", ["N06AX12"], "Small molecule", "4.0", 1, 1985, True, "bupropion", "CHEMBL894"),
-        ("CHEMBL2108724", ["A10BJ06"], "Protein", "4.0", 1, 2017, True, "semaglutide", "CHEMBL2108724"),
-    ],
+    _MOLECULE_CASES,
 )
 async def test_get_molecule(
-    chembl_client,
+    molecules_by_id,
     chembl_id,
     expected_atc,
     expected_type,
@@ -24,7 +46,7 @@ async def test_get_molecule(
     expected_pref_name,
     expected_parent_chembl_id,
 ):
-    result = await chembl_client.get_molecule(chembl_id)
+    result = molecules_by_id[chembl_id]
 
     assert isinstance(result, MoleculeData)
     assert result.molecule_chembl_id == chembl_id
@@ -1,10 +1,57 @@
 """Integration tests for ClinicalTrialsClient."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
 from indication_scout.agents.clinical_trials.clinical_trials_tools import _classify_stop_reason
 from indication_scout.data_sources.base_client import DataSourceError
-from indication_scout.models.model_clinical_trials import MeshTerm, TerminatedTrialsResult
+from indication_scout.models.model_clinical_trials import (
+    MeshTerm,
+    TerminatedTrialsResult,
+    Trial,
+)
+
+# Replay ClinicalTrials.gov responses from tests/integration/data_sources/cassettes/ once
+# recorded.
+pytestmark = pytest.mark.vcr
+
+# (nct_id, why_stopped_fragment, expected_category) for the negated-safety-phrase cases.
+_STOP_REASON_CASES = [
+    ("NCT00109577", "no adverse events", "Unable to recruit"),
+    ("NCT06134661", "unrelated to safety", "enrollment"),
+]
+_PREFETCH_NCT_IDS = [
+    "NCT00127933",
+    "NCT04971785",
+    *(case[0] for case in _STOP_REASON_CASES),
+]
+
+# Top-level fields of NCT00127933 (XeNA Study, Roche breast cancer trial).
+_EXPECTED_XENA = {
+    "nct_id": "NCT00127933",
+    "title": "XeNA Study - A Study of Xeloda (Capecitabine) in Patients With Invasive Breast Cancer",
+    "phase": "Phase 4",
+    "overall_status": "COMPLETED",
+    "why_stopped": None,
+    "indications": ["Breast Cancer"],
+    "sponsor": "Hoffmann-La Roche",
+    "enrollment": 157,
+    "start_date": "2005-08",
+    "completion_date": "2009-04",
+    "references": [],
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def trials_by_nct(clinical_trials_client, module_cassette) -> dict[str, Trial]:
+    """Fetch every trial the get_trial tests read, concurrently and once per module."""
+    with module_cassette("trials_by_nct"):
+        trials = await asyncio.gather(
+            *(clinical_trials_client.get_trial(nct_id) for nct_id in _PREFETCH_NCT_IDS)
+        )
+    return dict(zip(_PREFETCH_NCT_IDS, trials))
 
 
 # --- Main functionality ---
@@ -76,26 +123,13 @@ async def test_get_landscape(clinical_trials_client):
     assert tradipitant_comp.most_recent_start == "2024-01-09"
 
 
-async def test_get_trial(clinical_trials_client):
+async def test_get_trial(trials_by_nct):
     """Test get_trial returns a single trial by NCT ID."""
-    # Fetch NCT00127933 - XeNA Study (Roche breast cancer trial)
-    trial = await clinical_trials_client.get_trial("NCT00127933")
+    # NCT00127933 - XeNA Study (Roche breast cancer trial)
+    trial = trials_by_nct["NCT00127933"]
 
-    # Verify all Trial fields with exact values
-    assert trial.nct_id == "NCT00127933"
-    assert (
-        trial.title
-        == "XeNA Study - A Study of Xeloda (Capecitabine) in Patients With Invasive Breast Cancer"
-    )
-    assert trial.phase == "Phase 4"
-    assert trial.overall_status == "COMPLETED"
-    assert trial.why_stopped is None
-    assert trial.indications == ["Breast Cancer"]
-    assert trial.sponsor == "Hoffmann-La Roche"
-    assert trial.enrollment == 157
-    assert trial.start_date == "2005-08"
-    assert trial.completion_date == "2009-04"
-    assert trial.references == []
+    # Verify all top-level Trial fields with exact values
+    assert trial.model_dump(include=_EXPECTED_XENA.keys()) == _EXPECTED_XENA
 
     # Verify interventions - trial has 5 drug interventions
     assert len(trial.interventions) == 5
@@ -118,11 +152,12 @@ async def test_get_trial(clinical_trials_client):
     )
 
 
-async def test_search_trials_nash_trial_fields(clinical_trials_client):
+async def test_search_trials_nash_trial_fields(clinical_trials_client, trials_by_nct):
     """Verify all Trial fields (including MeSH ancestors) for NCT04971785.
 
     Covers both full-field parsing and conditionBrowseModule.ancestors
-    extraction in a single live call.
+    extraction in a single live call, and checks search_trials and get_trial
+    agree on the same record.
     """
     result = await clinical_trials_client.search_trials(
         drug="semaglutide",
@@ -170,6 +205,8 @@ async def test_search_trials_nash_trial_fields(clinical_trials_client):
         ("D004066", "Digestive System Diseases"),
     ]
 
+    assert nash_trial.model_dump() == trials_by_nct["NCT04971785"].model_dump()
+
 
 # --- Edge cases and weird inputs ---
 
@@ -182,24 +219,25 @@ async def test_get_trial_nonexistent_nct_id_raises_error(clinical_trials_client)
     assert "NCT99999999" in str(exc_info.value)
 
 
-@pytest.mark.parametrize(
-    "drug, mesh_term",
-    [
-        ("xyzzy_not_a_real_drug_12345", "Diabetes Mellitus"),
-        ("semaglutide", "xyzzy_fake_mesh_term_99999"),
-    ],
-    ids=["nonexistent_drug", "nonexistent_mesh_term"],
-)
-async def test_search_trials_invalid_input_returns_empty(
-    clinical_trials_client, drug, mesh_term
-):
-    """search_trials returns an empty SearchTrialsResult (no error) for unresolvable terms."""
-    result = await clinical_trials_client.search_trials(
-        drug=drug,
-        mesh_term=mesh_term,
+async def test_search_trials_invalid_input_returns_empty(clinical_trials_client):
+    """search_trials returns an empty SearchTrialsResult (no error) for unresolvable terms.
+
+    The nonexistent-drug and nonexistent-MeSH-term searches run concurrently.
+    """
+    cases = {
+        "nonexistent_drug": ("xyzzy_not_a_real_drug_12345", "Diabetes Mellitus"),
+        "nonexistent_mesh_term": ("semaglutide", "xyzzy_fake_mesh_term_99999"),
+    }
+    results = await asyncio.gather(
+        *(
+            clinical_trials_client.search_trials(drug=drug, mesh_term=mesh_term)
+            for drug, mesh_term in cases.values()
+        )
     )
-    assert result.total_count == 0
-    assert result.trials == []
+
+    for case, result in zip(cases, results):
+        assert result.total_count == 0, case
+        assert result.trials == [], case
 
 
 async def test_get_landscape_nonexistent_indication_returns_empty(
@@ -228,22 +266,10 @@ async def test_get_terminated_trials_nonexistent_query_returns_empty(
 
 
 @pytest.mark.parametrize(
-    "nct_id, why_stopped_fragment, expected_category",
-    [
-        (
-            "NCT00109577",
-            "no adverse events",  # negated safety phrase
-            "Unable to recruit",
-        ),
-        (
-            "NCT06134661",
-            "unrelated to safety",  # negated safety phrase
-            "enrollment",
-        ),
-    ],
+    "nct_id, why_stopped_fragment, expected_category", _STOP_REASON_CASES
 )
 async def test_classify_stop_reason_negation_on_live_data(
-    clinical_trials_client, nct_id, why_stopped_fragment, expected_category
+    trials_by_nct, nct_id, why_stopped_fragment, expected_category
 ):
     """_classify_stop_reason does not misclassify negated safety phrases as 'safety'.
 
@@ -252,7 +278,7 @@ async def test_classify_stop_reason_negation_on_live_data(
     """
 
 
-    trial = await clinical_trials_client.get_trial(nct_id)
+    trial = trials_by_nct[nct_id]
 
     assert trial.why_stopped is not None
     assert why_stopped_fragment in trial.why_stopped.lower()
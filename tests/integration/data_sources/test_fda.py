@@ -1,9 +1,12 @@
-"""Integration tests for FDAClient — hits real openFDA API."""
+"""Integration tests for FDAClient against the openFDA API."""
 
 import pytest
 
 from indication_scout.data_sources.fda import FDAClient
 
+# Replay openFDA responses from tests/integration/data_sources/cassettes/ once recorded.
+pytestmark = pytest.mark.vcr
+
 
 async def test_get_label_indications_wegovy(fda_client):
     """Wegovy returns label text with cardiovascular and weight management indications."""
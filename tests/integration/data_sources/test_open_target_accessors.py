@@ -1,6 +1,27 @@
 """Integration tests for OpenTargetsClient accessor methods."""
 
 import pytest
+import pytest_asyncio
+
+from indication_scout.models.model_open_targets import Interaction
+
+# Replay Open Targets responses from tests/integration/data_sources/cassettes/ once
+# recorded.
+pytestmark = pytest.mark.vcr
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def pdgfrb_interactions(open_targets_client, module_cassette) -> list[Interaction]:
+    """PDGFRB (ENSG00000113721) interactions, fetched once for the interaction tests.
+
+    Each accessor call re-reads and re-validates the full cached TargetData, so
+    the interaction tests below share one result instead.
+    """
+    with module_cassette("pdgfrb_interactions"):
+        return await open_targets_client.get_target_data_interactions(
+            "ENSG00000113721"
+        )
+
 
 # --- Target data accessors ---
 
@@ -34,16 +55,12 @@ async def test_get_target_pathways(open_targets_client):
     assert pdgf.top_level_pathway == "Signal Transduction"
 
 
-async def test_get_target_interactions(open_targets_client):
+async def test_get_target_interactions(pdgfrb_interactions):
     """Test get_target_interactions returns interaction data with all fields."""
-    interactions = await open_targets_client.get_target_data_interactions(
-        "ENSG00000113721"
-    )
-
-    assert len(interactions) > 10
+    assert len(pdgfrb_interactions) > 10
     plcg1 = next(
         i
-        for i in interactions
+        for i in pdgfrb_interactions
         if i.interacting_target_symbol == "PLCG1" and i.source_database == "string"
     )
     # Verify all Interaction fields
@@ -56,37 +73,35 @@ async def test_get_target_interactions(open_targets_client):
     assert plcg1.interaction_type == "functional"
 
 
-async def test_interaction_type_string_is_functional(open_targets_client):
-    """Test STRING interaction with all Interaction fields verified."""
-    interactions = await open_targets_client.get_target_data_interactions(
-        "ENSG00000113721"
-    )
+async def test_interaction_type_source_mapping(pdgfrb_interactions):
+    """Every interaction's type follows its source database.
 
-    # Pick PLCG1 interaction from STRING - verify all fields
-    plcg1_string = next(
-        i
-        for i in interactions
-        if i.interacting_target_symbol == "PLCG1" and i.source_database == "string"
-    )
-    assert plcg1_string.interacting_target_id == "ENSG00000124181"
-    assert plcg1_string.interacting_target_symbol == "PLCG1"
-    assert plcg1_string.interaction_score > 0.99
-    assert plcg1_string.source_database == "string"
-    assert plcg1_string.biological_role == "unspecified role"
-    assert plcg1_string.evidence_count == 4
-    assert plcg1_string.interaction_type == "functional"
+    Signor and Reactome data may not be currently available in Open Targets
+    API; their mappings are validated if such interactions are present.
+    """
+    expected_types = {
+        "string": "functional",
+        "intact": "physical",
+        "signor": "signalling",
+        "reactome": "enzymatic",
+    }
+    for interaction in pdgfrb_interactions:
+        if interaction.source_database in expected_types:
+            assert (
+                interaction.interaction_type
+                == expected_types[interaction.source_database]
+            ), interaction
 
+    sources = {i.source_database for i in pdgfrb_interactions}
+    assert {"string", "intact"} <= sources
 
-async def test_interaction_type_intact_is_physical(open_targets_client):
-    """Test IntAct interaction with all Interaction fields verified."""
-    interactions = await open_targets_client.get_target_data_interactions(
-        "ENSG00000113721"
-    )
 
+async def test_interaction_type_intact_is_physical(pdgfrb_interactions):
+    """Test IntAct interaction with all Interaction fields verified."""
     # Pick PLCG1 interaction from IntAct - verify all fields
     plcg1_intact = next(
         i
-        for i in interactions
+        for i in pdgfrb_interactions
         if i.interacting_target_symbol == "PLCG1" and i.source_database == "intact"
     )
     assert plcg1_intact.interacting_target_id == "ENSG00000124181"
@@ -98,36 +113,6 @@ async def test_interaction_type_intact_is_physical(open_targets_client):
     assert plcg1_intact.interaction_type == "physical"
 
 
-async def test_interaction_type_signor_is_signalling(open_targets_client):
-    """Test Signor interaction with all Interaction fields verified.
-
-    Note: Signor data may not be currently available in Open Targets API.
-    This test validates the mapping if Signor interactions are present.
-    """
-    interactions = await open_targets_client.get_target_data_interactions(
-        "ENSG00000113721"
-    )
-
-    signor_interactions = [i for i in interactions if i.source_database == "signor"]
-    for interaction in signor_interactions:
-        assert interaction.interaction_type == "signalling"
-
-
-async def test_interaction_type_reactome_is_enzymatic(open_targets_client):
-    """Test Reactome interaction with all Interaction fields verified.
-
-    Note: Reactome data may not be currently available in Open Targets API.
-    This test validates the mapping if Reactome interactions are present.
-    """
-    interactions = await open_targets_client.get_target_data_interactions(
-        "ENSG00000113721"
-    )
-
-    reactome_interactions = [i for i in interactions if i.source_database == "reactome"]
-    for interaction in reactome_interactions:
-        assert interaction.interaction_type == "enzymatic"
-
-
 async def test_get_target_drug_summaries(open_targets_client):
     """Test get_known_drugs returns drugs with all DrugSummary fields."""
     drug_summaries = await open_targets_client.get_target_data_drug_summaries(
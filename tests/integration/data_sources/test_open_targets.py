@@ -11,6 +11,9 @@ from indication_scout.markers import no_review
 
 logger = logging.getLogger(__name__)
 
+# Replay Open Targets responses from tests/integration/data_sources/cassettes/ once
+# recorded.
+pytestmark = pytest.mark.vcr
 
 # --- get_drug ---
 
@@ -22,7 +25,7 @@ async def test_sildenafil_drug_data(open_targets_client):
     indications = drug.indications
     match = [i for i in indications if "kidney" in i.disease_name.lower()]
     approved = [a for a in match if a.disease_id in drug.approved_disease_ids]
-    logger.info(drug.indications)
+    logger.info("%s", drug.indications)
 
 
 # TODO delete
@@ -1,6 +1,43 @@
 """Integration tests for PubMedClient."""
 
+from collections.abc import Iterable
+
 import pytest
+import pytest_asyncio
+
+from indication_scout.models.model_pubmed_abstract import PubmedAbstract
+
+# Replay NCBI responses from tests/integration/data_sources/cassettes/ once recorded.
+pytestmark = pytest.mark.vcr
+
+# PMIDs whose parsed fields are asserted below. Fetched together in one efetch
+# round-trip by the known_articles fixture instead of once per test.
+_KNOWN_PMIDS: list[str] = ["41664890", "39215927"]
+
+
+def _assert_contains_all(expected: Iterable[str], actual: Iterable[str]) -> None:
+    """Assert every expected item is in actual, reporting all missing items at once."""
+    missing = set(expected) - set(actual)
+    assert not missing, f"missing: {sorted(missing)}"
+
+
+def _assert_substrings(expected: Iterable[str], text: str) -> None:
+    """Assert every expected phrase occurs in text, reporting all missing phrases at once."""
+    missing = [phrase for phrase in expected if phrase not in text]
+    assert not missing, f"missing from text: {missing}"
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def known_articles(pubmed_client, module_cassette) -> dict[str, PubmedAbstract]:
+    """Fetch every PMID in _KNOWN_PMIDS in a single efetch call, keyed by PMID.
+
+    Module-scoped so the round-trip and XML parse happen once for all tests
+    that assert on specific articles.
+    """
+    with module_cassette("known_articles"):
+        articles = await pubmed_client.fetch_abstracts(_KNOWN_PMIDS)
+    return {a.pmid: a for a in articles}
+
 
 # --- Main functionality ---
 
@@ -40,14 +77,15 @@ async def test_get_count_returns_total(pubmed_client):
     assert count > 500
 
 
-async def test_fetch_articles_parses_correctly(pubmed_client):
+async def test_fetch_articles_parses_correctly(pubmed_client, known_articles):
     """Test fetch_articles returns parsed PubmedAbstract objects."""
-    # First search for a known article
+    # Search must surface the known article; its parsed content comes from the
+    # shared module-level fetch.
     pmids = await pubmed_client.search("semaglutide obesity clinical trial")
-    articles = await pubmed_client.fetch_abstracts(pmids)
 
-    assert len(articles) >= 5
-    [article] = [a for a in articles if a.pmid == "41664890"]
+    assert len(pmids) >= 5
+    assert "41664890" in pmids
+    article = known_articles["41664890"]
 
     assert article.pmid.isdigit()
     assert (
@@ -61,8 +99,7 @@ async def test_fetch_articles_parses_correctly(pubmed_client):
         "semaglutide",
         "tirzepatide",
     ]
-    for k in expected_keywords:
-        assert k in article.keywords
+    _assert_contains_all(expected_keywords, article.keywords)
 
     expected_fields = [
         "obesity",
@@ -70,17 +107,20 @@ async def test_fetch_articles_parses_correctly(pubmed_client):
         "GLP-1",
         "percentage weight reduction",
     ]
-    for e in expected_fields:
-        assert e in article.abstract
+    _assert_substrings(expected_fields, article.abstract)
 
 
 async def test_fetch_specific_article(pubmed_client):
-    """Test fetching a specific known article by PMID."""
+    """Test fetching bibliographic fields for a specific known article by PMID.
+
+    Only title/journal/authors are asserted, so this uses the esummary path
+    rather than a full efetch.
+    """
     # PMID 27633186 - SUSTAIN-6 semaglutide cardiovascular trial (NEJM 2016)
-    articles = await pubmed_client.fetch_abstracts(["27633186"])
+    summaries = await pubmed_client.fetch_summaries(["27633186"])
 
-    assert len(articles) == 1
-    article = articles[0]
+    assert len(summaries) == 1
+    article = summaries[0]
 
     assert article.pmid == "27633186"
     assert "semaglutide" in article.title.lower()
@@ -90,16 +130,13 @@ async def test_fetch_specific_article(pubmed_client):
     assert article.authors[0].startswith("Marso")
 
 
-async def test_fetch_abstracts_parses_biguanide_colon_cancer_article(pubmed_client):
+async def test_fetch_abstracts_parses_biguanide_colon_cancer_article(known_articles):
     """Verify field parsing for PMID 39215927 (metformin / small intestine / prostate cancer).
 
     Checks title, authors, journal, pub_date, mesh_terms, keywords, and two
     phrases that must appear in the abstract body.
     """
-    articles = await pubmed_client.fetch_abstracts(["39215927"])
-
-    assert len(articles) == 1
-    article = articles[0]
+    article = known_articles["39215927"]
 
     assert article.pmid == "39215927"
     assert article.title == (
@@ -132,8 +169,7 @@ async def test_fetch_abstracts_parses_biguanide_colon_cancer_article(pubmed_clie
         "Glutathione",
         "Reactive Oxygen Species",
     ]
-    for term in expected_mesh:
-        assert term in article.mesh_terms, f"missing mesh term: {term}"
+    _assert_contains_all(expected_mesh, article.mesh_terms)
 
     assert article.keywords == [
         "Cancer",
@@ -143,8 +179,9 @@ async def test_fetch_abstracts_parses_biguanide_colon_cancer_article(pubmed_clie
         "Small intestine",
     ]
 
-    assert "glutathione (reduced) levels" in article.abstract
-    assert "histopathological damage" in article.abstract
+    _assert_substrings(
+        ["glutathione (reduced) levels", "histopathological damage"], article.abstract
+    )
 
 
 async def test_fetch_articles_empty_list_returns_empty(pubmed_client):
@@ -1,9 +1,11 @@
 """Integration tests for services/disease_normalizer."""
 
 import logging
+from pathlib import Path
 from unittest.mock import patch, AsyncMock
 
 import pytest
+import pytest_asyncio
 
 from indication_scout.markers import no_review
 from indication_scout.services.disease_helper import (
@@ -18,6 +20,11 @@ from indication_scout.services.disease_helper import (
 logger = logging.getLogger(__name__)
 
 
+def _or_terms(result: str) -> list[str]:
+    """Split a normalize_for_pubmed result on OR into lowercased, stripped terms."""
+    return [t.strip().lower() for t in result.split("OR")]
+
+
 @no_review
 # Exclude from testing rules, TODO delete
 async def test_single_disease_normalizer():
@@ -36,10 +43,10 @@ async def test_single_drug_disease_normalizer():
     assert result
 
 
-async def test_normalize_returns_multiple_terms():
+async def test_normalize_returns_multiple_terms(cached_normalize_for_pubmed):
     # "atopic eczema" should normalize to two terms joined by OR (e.g. "eczema OR dermatitis")
-    result = await normalize_for_pubmed("atopic eczema", None)
-    terms = [t.strip().lower() for t in result.split("OR")]
+    result = await cached_normalize_for_pubmed("atopic eczema", None)
+    terms = _or_terms(result)
     assert len(terms) == 2
     assert terms[0] == "eczema"
     assert terms[1] == "dermatitis"
@@ -53,17 +60,19 @@ async def test_normalize_returns_multiple_terms():
         "malignancy",
     ],
 )
-async def test_blocklist_terms_return_raw_term(raw_term):
+async def test_blocklist_terms_return_raw_term(cached_normalize_for_pubmed, raw_term):
     """Bare blocklisted terms should be returned unchanged (not further generalized)."""
-    result = await normalize_for_pubmed(raw_term, drug_name=None)
-    result_terms = {t.strip().lower() for t in result.split("OR")}
+    result = await cached_normalize_for_pubmed(raw_term, drug_name=None)
+    result_terms = set(_or_terms(result))
     assert raw_term.lower() in result_terms
 
 
-async def test_organ_specificity_not_lost_for_cancer_terms():
+async def test_organ_specificity_not_lost_for_cancer_terms(cached_normalize_for_pubmed):
     """Organ-specific cancer terms must retain organ context, not collapse to bare 'cancer'."""
-    result = await normalize_for_pubmed("non-small cell lung carcinoma", drug_name=None)
-    terms = [t.strip().lower() for t in result.split("OR")]
+    result = await cached_normalize_for_pubmed(
+        "non-small cell lung carcinoma", drug_name=None
+    )
+    terms = _or_terms(result)
     assert any("lung" in t for t in terms)
 
 
@@ -77,11 +86,13 @@ async def test_organ_specificity_not_lost_for_cancer_terms():
         ("myelofibrosis", "baricitinib", "myelofibrosis"),
     ],
 )
-async def test_multiple_drug_disease_normalizer(disease, drug, required_keyword):
+async def test_multiple_drug_disease_normalizer(
+    cached_normalize_for_pubmed, disease, drug, required_keyword
+):
     """normalize_for_pubmed with a drug name returns a non-empty, specific result."""
-    result = await normalize_for_pubmed(disease, drug_name=drug)
+    result = await cached_normalize_for_pubmed(disease, drug_name=drug)
     assert result, f"Expected a non-empty result for {drug} + {disease}"
-    result_terms = {t.strip().lower() for t in result.split("OR")}
+    result_terms = set(_or_terms(result))
     assert not (
         result_terms <= BROADENING_BLOCKLIST
     ), f"Result '{result}' collapsed to over-generic terms for {drug} + {disease}"
@@ -122,46 +133,45 @@ async def test_merge_duplicate_diseases():
     assert "obesity" in result["remove"]
 
 
-async def test_llm_normalize_disease_batch_returns_correct_forms(tmp_path):
-    """llm_normalize_disease_batch returns correct normalised forms for known disease terms.
+# Both batch tests run against one primed cache, so the batch prompt hits the LLM once.
+_BATCH_TERMS: list[str] = ["type 2 diabetes mellitus", "narcolepsy-cataplexy syndrome"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def primed_batch_cache(tmp_path_factory) -> tuple[Path, dict[str, str]]:
+    """Run llm_normalize_disease_batch once on _BATCH_TERMS against an isolated cache.
 
-    Uses a tmp_path cache so this test is isolated from production cache state.
-    Run once, observe the output, then fill in the expected values below.
+    Returns the cache dir and the first-call result. Uses its own tmp dir so it
+    is isolated from production cache state.
     """
-    with patch("indication_scout.services.disease_helper.DEFAULT_CACHE_DIR", tmp_path):
-        result = await llm_normalize_disease_batch(
-            ["type 2 diabetes mellitus", "narcolepsy-cataplexy syndrome"]
-        )
-
-    assert set(result.keys()) == {
-        "type 2 diabetes mellitus",
-        "narcolepsy-cataplexy syndrome",
-    }
+    cache_dir = tmp_path_factory.mktemp("disease_norm_batch")
+    with patch("indication_scout.services.disease_helper.DEFAULT_CACHE_DIR", cache_dir):
+        result = await llm_normalize_disease_batch(_BATCH_TERMS)
+    return cache_dir, result
+
+
+async def test_llm_normalize_disease_batch_returns_correct_forms(primed_batch_cache):
+    """llm_normalize_disease_batch returns correct normalised forms for known disease terms."""
+    _, result = primed_batch_cache
+
+    assert set(result.keys()) == set(_BATCH_TERMS)
     assert result["type 2 diabetes mellitus"] == "type 2 diabetes OR diabetes mellitus"
     assert result["narcolepsy-cataplexy syndrome"] == "narcolepsy"
 
 
-async def test_llm_normalize_disease_batch_second_call_uses_cache(tmp_path):
+async def test_llm_normalize_disease_batch_second_call_uses_cache(primed_batch_cache):
     """Second call for the same terms returns from cache with no LLM call."""
-    with patch("indication_scout.services.disease_helper.DEFAULT_CACHE_DIR", tmp_path):
-        # Prime the cache
-        await llm_normalize_disease_batch(
-            ["type 2 diabetes mellitus", "narcolepsy-cataplexy syndrome"]
-        )
+    cache_dir, first = primed_batch_cache
 
+    with patch("indication_scout.services.disease_helper.DEFAULT_CACHE_DIR", cache_dir):
         # Second call — LLM must not be invoked
         with patch(
             "indication_scout.services.disease_helper.query_small_llm",
             new=AsyncMock(side_effect=AssertionError("LLM called on second request")),
         ):
-            result = await llm_normalize_disease_batch(
-                ["type 2 diabetes mellitus", "narcolepsy-cataplexy syndrome"]
-            )
-
-    assert set(result.keys()) == {
-        "type 2 diabetes mellitus",
-        "narcolepsy-cataplexy syndrome",
-    }
+            result = await llm_normalize_disease_batch(_BATCH_TERMS)
+
+    assert result == first
 
 
 async def test_normalize_batch_returns_pubmed_friendly_term(test_cache_dir):
@@ -5,7 +5,7 @@ import numpy as np
 from indication_scout.services.embeddings import embed
 
 
-def test_embed_determinism():
+def test_embed_determinism(biolord_model):
     """Encoding the same string twice produces identical vectors.
 
     BioLORD-2023 is a deterministic model (no dropout at inference time),
@@ -16,10 +16,10 @@ def test_embed_determinism():
     result_a = embed([text])
     result_b = embed([text])
 
-    assert np.allclose(result_a[0], result_b[0])
+    assert np.array_equal(result_a[0], result_b[0])
 
 
-def test_embed_batch_shape():
+def test_embed_batch_shape(biolord_model):
     """Encoding 5 strings returns 5 vectors each of length 768.
 
     768 is BioLORD-2023's output dimension. Verifying this here catches
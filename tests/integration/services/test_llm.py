@@ -1,11 +1,12 @@
 """Integration tests for services/llm."""
 
-import logging
-
+import pytest
 
 from indication_scout.services.llm import query_llm, query_small_llm
 
-logger = logging.getLogger(__name__)
+# Replay Anthropic responses from tests/integration/services/cassettes/ once recorded.
+# vcr_config matches on body, so each prompt replays its own frozen response.
+pytestmark = pytest.mark.vcr
 
 
 async def test_query_small_llm_returns_string():
@@ -1,6 +1,7 @@
 """Integration tests for services/pubmed_query."""
 
 import logging
+import re
 
 import pytest
 
@@ -11,6 +12,12 @@ from indication_scout.services.pubmed_query import (
 
 logger = logging.getLogger(__name__)
 
+# Replay NCBI + LLM responses from tests/integration/services/cassettes/ once recorded.
+pytestmark = pytest.mark.vcr
+
+# '<disease> AND <drug>' with exactly one AND; neither side may itself contain " AND ".
+_QUERY_RE = re.compile(r"(?P<disease>(?:(?! AND ).)+) AND (?P<drug>(?:(?! AND ).)+)")
+
 
 @pytest.mark.parametrize(
     "drug_name, disease_name, expected_drug, expected_disease_keywords",
@@ -48,34 +55,36 @@ logger = logging.getLogger(__name__)
     ],
 )
 async def test_get_pubmed_query(
-    drug_name, disease_name, expected_drug, expected_disease_keywords
+    cached_get_pubmed_query,
+    drug_name,
+    disease_name,
+    expected_drug,
+    expected_disease_keywords,
 ):
     """Each query must be '<disease_term> AND <drug>' with recognisable disease keywords."""
-    result = await get_pubmed_query(drug_name, disease_name)
+    result = await cached_get_pubmed_query(drug_name, disease_name)
 
     assert isinstance(result, list)
     assert len(result) >= 1
     for q in result:
-        parts = q.split(" AND ")
-        assert len(parts) == 2
-        disease_part, drug_part = parts
-        assert drug_part.strip() == expected_drug
-        assert any(kw in disease_part.lower() for kw in expected_disease_keywords)
+        m = _QUERY_RE.fullmatch(q)
+        assert m, f"Malformed query: {q!r}"
+        assert m["drug"].strip() == expected_drug
+        assert any(kw in m["disease"].lower() for kw in expected_disease_keywords)
 
 
-async def test_get_pubmed_query_returns_drug_and_term():
+async def test_get_pubmed_query_returns_drug_and_term(cached_get_pubmed_query):
     """Each query must be a '<disease> AND <drug>' string with a diabetes-related disease term."""
-    result = await get_pubmed_query("metformin", "type 2 diabetes mellitus")
+    result = await cached_get_pubmed_query("metformin", "type 2 diabetes mellitus")
 
     assert isinstance(result, list)
     assert len(result) >= 1
     for q in result:
-        parts = q.split(" AND ")
-        assert len(parts) == 2
-        disease_part, drug_part = parts
-        assert drug_part.strip() == "metformin"
+        m = _QUERY_RE.fullmatch(q)
+        assert m, f"Malformed query: {q!r}"
+        assert m["drug"].strip() == "metformin"
         assert any(
-            w in disease_part.lower()
+            w in m["disease"].lower()
             for w in ("diabetes", "metabolic", "glucose", "insulin")
         )
 
@@ -89,18 +98,17 @@ async def test_get_single_pubmed_query_returns_drug_and_term():
     assert len(results) >= 1
 
 
-async def test_get_pubmed_query_edge():
+async def test_get_pubmed_query_edge(cached_get_pubmed_query):
     """Each query must be a '<disease> AND <drug>' string."""
-    result = await get_pubmed_query("bupropion", "narcolepsy-cataplexy syndrome")
+    result = await cached_get_pubmed_query("bupropion", "narcolepsy-cataplexy syndrome")
 
     assert isinstance(result, list)
     assert len(result) >= 1
     for q in result:
-        parts = q.split(" AND ")
-        assert len(parts) == 2
-        disease_part, drug_part = parts
-        assert disease_part.strip() != ""
-        assert drug_part.strip() == "bupropion"
+        m = _QUERY_RE.fullmatch(q)
+        assert m, f"Malformed query: {q!r}"
+        assert m["disease"].strip() != ""
+        assert m["drug"].strip() == "bupropion"
 
 
 # async def test_expand_search_terms_metformin_colorectal():
@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, patch
 
 
+import aiohttp
 import pytest
 
 from indication_scout.data_sources.base_client import BaseClient, DataSourceError
@@ -51,6 +52,37 @@ async def test_session_reuse():
     await client.close()
 
 
+async def test_clients_share_connection_pool():
+    """Clients on the same loop share one connector, and closing one client's
+    session leaves the pool open for the others."""
+    async with ConcreteTestClient() as first, ConcreteTestClient() as second:
+        session1 = await first._get_session()
+        session2 = await second._get_session()
+        assert session1 is not session2
+        connector = session1.connector
+        assert session2.connector is connector
+
+        await first.close()
+        assert session1.closed
+        assert not connector.closed
+
+    assert connector.closed
+
+
+async def test_close_twice_releases_shared_pool_once():
+    """A second close() is a no-op, so it cannot drop another client's hold
+    on the shared connector."""
+    async with ConcreteTestClient() as first, ConcreteTestClient() as second:
+        await first._get_session()
+        connector = (await second._get_session()).connector
+
+        await first.close()
+        await first.close()
+        assert not connector.closed
+
+    assert connector.closed
+
+
 # --- _graphql error handling ---
 
 
@@ -85,6 +117,47 @@ async def test_graphql_errors_in_response_raises_datasource_error():
         assert exc_info.value.source == "test_client"
 
 
+async def test_request_parses_json_from_body_bytes():
+    """JSON responses are parsed straight from the body bytes."""
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.read = AsyncMock(return_value=b'{"data": {"ok": true}}')
+
+    mock_session = AsyncMock()
+    mock_session.post = AsyncMock(return_value=mock_resp)
+
+    client = ConcreteTestClient()
+    with patch.object(
+        client, "_get_session", new_callable=AsyncMock, return_value=mock_session
+    ):
+        result = await client._graphql("https://example.com/graphql", "{ ok }", {})
+
+    assert result == {"data": {"ok": True}}
+    mock_resp.text.assert_not_awaited()
+
+
+async def test_request_invalid_json_raises_after_retries():
+    """A non-JSON 200 body is retried, then surfaces as DataSourceError."""
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.read = AsyncMock(return_value=b"<html>Service busy</html>")
+
+    mock_session = AsyncMock()
+    mock_session.get = AsyncMock(return_value=mock_resp)
+
+    client = _make_client(max_retries=1)
+    with (
+        patch.object(
+            client, "_get_session", new_callable=AsyncMock, return_value=mock_session
+        ),
+        patch("indication_scout.data_sources.base_client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        with pytest.raises(DataSourceError, match="Invalid JSON response"):
+            await client._rest_get("https://example.com/api", params={})
+
+    assert mock_session.get.await_count == 2
+
+
 # --- _rest_get_xml ---
 
 
@@ -180,6 +253,38 @@ async def test_rest_get_xml_raises_after_exhausting_retries_on_5xx():
     assert mock_session.get.call_count == 3
 
 
+# --- _rest_get_streamed ---
+
+
+async def test_rest_get_streamed_retries_when_body_read_fails():
+    """consume() runs inside the retry loop: a payload error mid-body retries the GET."""
+    first_resp = AsyncMock()
+    first_resp.status = 200
+    second_resp = AsyncMock()
+    second_resp.status = 200
+
+    mock_session = AsyncMock()
+    mock_session.get = AsyncMock(side_effect=[first_resp, second_resp])
+    consume = AsyncMock(
+        side_effect=[aiohttp.ClientPayloadError("connection dropped"), ["parsed"]]
+    )
+
+    client = _make_client(max_retries=1)
+    with patch.object(
+        client, "_get_session", new_callable=AsyncMock, return_value=mock_session
+    ):
+        with patch(
+            "indication_scout.data_sources.base_client.asyncio.sleep",
+            new_callable=AsyncMock,
+        ):
+            result = await client._rest_get_streamed(
+                "https://example.com/xml", params={}, consume=consume
+            )
+
+    assert result == ["parsed"]
+    assert [call.args[0] for call in consume.await_args_list] == [first_resp, second_resp]
+
+
 # --- DataSourceError ---
 
 
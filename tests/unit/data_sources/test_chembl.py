@@ -173,6 +173,18 @@ async def test_get_molecule_null_atc_returns_empty_list(tmp_path):
     assert result.atc_classifications == []
 
 
+async def test_get_molecule_served_from_cache_on_second_call(tmp_path):
+    client = ChEMBLClient(cache_dir=tmp_path)
+    rest_get = AsyncMock(return_value=CHEMBL894_FIXTURE)
+    with patch.object(client, "_rest_get", new=rest_get):
+        first = await client.get_molecule("CHEMBL894")
+        second = await client.get_molecule("CHEMBL894")
+
+    assert second == first
+    assert second.pref_name == "bupropion"
+    rest_get.assert_awaited_once()
+
+
 # --- get_atc_description ---
 
 ATC_A10BA02_FIXTURE = {
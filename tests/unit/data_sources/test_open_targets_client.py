@@ -684,3 +684,34 @@ async def test_get_target_evidences_drops_cross_disease_rows(tmp_path):
 
     assert len(result["EFO_A"]) == 1
     assert result["EFO_A"][0].disease_id == "EFO_A"
+
+
+async def test_get_disease_synonyms_cached_by_normalized_name(tmp_path):
+    """A repeat lookup under a different case/whitespace is served from the
+    disease_id_resolver and disease_synonyms caches: no name search, no query."""
+    client = OpenTargetsClient(cache_dir=tmp_path)
+    search_response = {
+        "data": {"search": {"hits": [{"id": "EFO_0000339", "entity": "disease"}]}}
+    }
+    synonyms_response = {
+        "data": {
+            "disease": {
+                "id": "EFO_0000339",
+                "name": "Chronic Myelogenous Leukemia",
+                "synonyms": [{"relation": "hasExactSynonym", "terms": ["CML"]}],
+                "parents": [{"name": "myeloid leukemia"}],
+            }
+        }
+    }
+    mock_gql = AsyncMock(side_effect=[search_response, synonyms_response])
+
+    with patch.object(client, "_graphql", mock_gql):
+        first = await client.get_disease_synonyms("CML")
+        second = await client.get_disease_synonyms(" cml ")
+
+    assert mock_gql.await_count == 2
+    assert second == first
+    assert second.disease_id == "EFO_0000339"
+    assert second.disease_name == "chronic myelogenous leukemia"
+    assert second.exact == ["CML"]
+    assert second.parent_names == ["myeloid leukemia"]
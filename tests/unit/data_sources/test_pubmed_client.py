@@ -1,5 +1,8 @@
 """Unit tests for PubMedClient."""
 
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from indication_scout.data_sources.base_client import DataSourceError
@@ -196,3 +199,156 @@ def test_book_article_excludes_editors_from_authors():
 
     assert len(result) == 1
     assert result[0].authors == ["Author, One"]
+
+
+# --- _parse_esummary ---
+
+
+def test_parse_esummary_extracts_fields_and_skips_errors():
+    """Docsums map to PubmedSummary in uids order; editors and error UIDs are dropped."""
+    data = {
+        "result": {
+            "uids": ["27633186", "99999999999"],
+            "27633186": {
+                "uid": "27633186",
+                "title": "Semaglutide and Cardiovascular Outcomes in Patients with Type 2 Diabetes.",
+                "fulljournalname": "The New England journal of medicine",
+                "pubdate": "2016 Nov 10",
+                "authors": [
+                    {"name": "Marso SP", "authtype": "Author"},
+                    {"name": "Bain SC", "authtype": "Author"},
+                    {"name": "SUSTAIN-6 Investigators", "authtype": "CollectiveName"},
+                ],
+            },
+            "99999999999": {"uid": "99999999999", "error": "cannot get document summary"},
+        }
+    }
+
+    result = PubMedClient._parse_esummary(data)
+
+    assert len(result) == 1
+    summary = result[0]
+    assert summary.pmid == "27633186"
+    assert (
+        summary.title
+        == "Semaglutide and Cardiovascular Outcomes in Patients with Type 2 Diabetes."
+    )
+    assert summary.authors == ["Marso SP", "Bain SC"]
+    assert summary.journal == "The New England journal of medicine"
+    assert summary.pub_date == "2016 Nov 10"
+
+
+# --- fetch_summaries ---
+
+
+async def test_fetch_summaries_splits_batches_and_keeps_order(tmp_path):
+    """Each batch is one esummary call; results come back in input order across batches."""
+    client = PubMedClient(cache_dir=tmp_path)
+
+    async def fake_get_json(url, params):
+        ids = params["id"].split(",")
+        return {"result": {"uids": ids, **{p: {"title": f"Title {p}"} for p in ids}}}
+
+    mock_get_json = AsyncMock(side_effect=fake_get_json)
+    with patch.object(client, "_rest_get_json_tolerant", mock_get_json):
+        summaries = await client.fetch_summaries(
+            ["1", "2", "3", "4", "5"], batch_size=2
+        )
+
+    assert mock_get_json.await_count == 3
+    assert [call.args[1]["id"] for call in mock_get_json.await_args_list] == [
+        "1,2",
+        "3,4",
+        "5",
+    ]
+    assert [s.pmid for s in summaries] == ["1", "2", "3", "4", "5"]
+    assert summaries[4].title == "Title 5"
+
+
+# --- fetch_abstracts ---
+
+
+def _efetch_xml(pmids: list[str]) -> str:
+    """Minimal efetch XML with one titled article per PMID."""
+    articles = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{p}</PMID><Article>"
+        f"<ArticleTitle>Title {p}</ArticleTitle></Article></MedlineCitation></PubmedArticle>"
+        for p in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+
+
+def _streamed_response(body: bytes, chunk_size: int) -> MagicMock:
+    """Response stand-in whose content.iter_chunked yields body in chunk_size pieces."""
+
+    async def iter_chunked(_):
+        for i in range(0, len(body), chunk_size):
+            yield body[i : i + chunk_size]
+
+    resp = MagicMock()
+    resp.content.iter_chunked = iter_chunked
+    return resp
+
+
+async def test_fetch_abstracts_splits_batches_and_keeps_order(tmp_path):
+    """Each batch is one efetch call; results come back in input order across batches."""
+    client = PubMedClient(cache_dir=tmp_path)
+
+    async def fake_get_streamed(url, params, consume):
+        body = _efetch_xml(params["id"].split(",")).encode()
+        return await consume(_streamed_response(body, chunk_size=7))
+
+    mock_get_streamed = AsyncMock(side_effect=fake_get_streamed)
+    with patch.object(client, "_rest_get_streamed", mock_get_streamed):
+        articles = await client.fetch_abstracts(["1", "2", "3", "4", "5"], batch_size=2)
+
+    assert mock_get_streamed.await_count == 3
+    assert [call.args[1]["id"] for call in mock_get_streamed.await_args_list] == [
+        "1,2",
+        "3,4",
+        "5",
+    ]
+    assert [a.pmid for a in articles] == ["1", "2", "3", "4", "5"]
+    assert articles[4].title == "Title 5"
+
+
+async def test_read_efetch_stream_strips_control_chars_and_rejects_truncated_body(tmp_path):
+    """Invalid XML control bytes are dropped per chunk; a body cut off mid-document
+    raises DataSourceError once the stream ends."""
+    client = PubMedClient(cache_dir=tmp_path)
+    body = _efetch_xml(["1", "2"]).replace("Title 2", "Title\x0b 2").encode()
+
+    articles = await client._read_efetch_stream(_streamed_response(body, chunk_size=5))
+
+    assert [a.title for a in articles] == ["Title 1", "Title 2"]
+    with pytest.raises(DataSourceError, match="Failed to parse XML"):
+        await client._read_efetch_stream(_streamed_response(body[:-10], chunk_size=5))
+
+
+# --- _filter_pmids_by_date ---
+
+
+async def test_filter_pmids_by_date_batches_and_keeps_input_order(tmp_path):
+    """One esummary call per batch; PMIDs dated on/after the cutoff are dropped,
+    missing or unparseable dates are kept, and input order is preserved."""
+    client = PubMedClient(cache_dir=tmp_path)
+    sortpubdates = {
+        "1": "2019/05/01 00:00",
+        "2": "2021/01/01 00:00",
+        "3": "",
+        "4": "not a date",
+        "5": "2020/12/31 00:00",
+    }
+
+    async def fake_get_json(url, params):
+        ids = params["id"].split(",")
+        return {"result": {p: {"sortpubdate": sortpubdates[p]} for p in ids}}
+
+    mock_get_json = AsyncMock(side_effect=fake_get_json)
+    with patch.object(client, "_rest_get_json_tolerant", mock_get_json):
+        kept = await client._filter_pmids_by_date(
+            ["1", "2", "3", "4", "5"], date(2021, 1, 1), batch_size=2
+        )
+
+    assert mock_get_json.await_count == 3
+    assert kept == ["1", "3", "4", "5"]
@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 import indication_scout.services.embeddings as embeddings_module
+from indication_scout.config import get_settings
 from indication_scout.services.embeddings import embed
 
 
@@ -56,7 +57,8 @@ def test_embed_passes_texts_to_encode():
     """embed() forwards the full text list to encode() unchanged.
 
     Also asserts convert_to_numpy=True is passed — this is required so that
-    the return value is an ndarray we can call .tolist() on per vector.
+    the return value is an ndarray we can call .tolist() on — and that the
+    batch size comes from settings.
     """
     mock_model = _make_mock_model(n_texts=2)
     texts = ["metformin and colorectal cancer", "AMPK activation in colon"]
@@ -66,7 +68,13 @@ def test_embed_passes_texts_to_encode():
     ):
         embed(texts)
 
-    mock_model.encode.assert_called_once_with(texts, convert_to_numpy=True)
+    mock_model.encode.assert_called_once_with(
+        texts,
+        batch_size=get_settings().embedding_batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
 
 
 def test_embed_returns_one_vector_per_text():
@@ -100,3 +108,80 @@ def test_singleton_not_reinstantiated_across_calls():
         embed(["second call"])
 
     mock_cls.assert_called_once()
+
+
+def _torch_settings(embedding_fp16: bool) -> MagicMock:
+    return MagicMock(
+        embedding_model="FremyCompany/BioLORD-2023",
+        embedding_backend="torch",
+        embedding_onnx_file=None,
+        embedding_fp16=embedding_fp16,
+        embedding_batch_size=64,
+    )
+
+
+@pytest.mark.parametrize("embedding_fp16, expect_half", [(True, True), (False, False)])
+def test_model_cast_to_fp16_only_when_enabled(embedding_fp16, expect_half):
+    """FP16 is opt-in: a CUDA model stays FP32 unless EMBEDDING_FP16 is set."""
+    mock_model = _make_mock_model(n_texts=1)
+    mock_model.device.type = "cuda"
+    with (
+        patch(
+            "indication_scout.services.embeddings.get_settings",
+            return_value=_torch_settings(embedding_fp16),
+        ),
+        patch(
+            "indication_scout.services.embeddings.SentenceTransformer",
+            return_value=mock_model,
+        ),
+    ):
+        embed(["some biomedical text"])
+
+    assert mock_model.half.called is expect_half
+
+
+def test_fp16_without_cuda_raises():
+    """EMBEDDING_FP16 on a CPU host fails instead of silently staying in FP32."""
+    mock_model = _make_mock_model(n_texts=1)
+    mock_model.device.type = "cpu"
+    with (
+        patch(
+            "indication_scout.services.embeddings.get_settings",
+            return_value=_torch_settings(True),
+        ),
+        patch(
+            "indication_scout.services.embeddings.SentenceTransformer",
+            return_value=mock_model,
+        ),
+        pytest.raises(ValueError, match="EMBEDDING_FP16"),
+    ):
+        embed(["some biomedical text"])
+
+    assert embeddings_module._model is None
+
+
+def test_onnx_backend_loads_requested_export():
+    """EMBEDDING_BACKEND=onnx loads through ONNX Runtime with the configured file."""
+    mock_model = _make_mock_model(n_texts=1)
+    settings = MagicMock(
+        embedding_model="FremyCompany/BioLORD-2023",
+        embedding_backend="onnx",
+        embedding_onnx_file="onnx/model_qint8_avx512_vnni.onnx",
+        embedding_batch_size=64,
+    )
+    with (
+        patch("indication_scout.services.embeddings.get_settings", return_value=settings),
+        patch(
+            "indication_scout.services.embeddings.SentenceTransformer",
+            return_value=mock_model,
+        ) as mock_cls,
+    ):
+        embed(["some biomedical text"])
+
+    mock_cls.assert_called_once_with(
+        "FremyCompany/BioLORD-2023",
+        backend="onnx",
+        model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+        local_files_only=True,
+    )
+    mock_model.half.assert_not_called()
@@ -158,7 +158,8 @@ async def test_extract_organ_term_returns_stripped_string(svc):
     assert result == "colon"
 
 
-async def test_extract_organ_term_returns_cached_result(tmp_path):
+@pytest.mark.parametrize("disease_name", ["colorectal cancer", " Colorectal Cancer "])
+async def test_extract_organ_term_returns_cached_result(tmp_path, disease_name):
     from indication_scout.utils.cache import cache_set
 
     cache_set("organ_term", {"disease_name": "colorectal cancer"}, "colon", tmp_path)
@@ -167,9 +168,7 @@ async def test_extract_organ_term_returns_cached_result(tmp_path):
         "indication_scout.services.retrieval.query_small_llm",
         new=AsyncMock(),
     ) as mock_llm:
-        result = await RetrievalService(tmp_path).extract_organ_term(
-            "colorectal cancer"
-        )
+        result = await RetrievalService(tmp_path).extract_organ_term(disease_name)
 
     assert result == "colon"
     mock_llm.assert_not_called()
@@ -368,26 +367,40 @@ async def test_expand_search_terms_deduplicates_output(tmp_path, metformin_profi
 
 
 async def test_expand_search_terms_returns_cached_result(tmp_path, metformin_profile):
-    from indication_scout.utils.cache import cache_set
-
-    cached_queries = ["metformin AND colorectal cancer", "biguanides AND colon"]
-    cache_set(
-        "expand_search_terms",
-        {"chembl_id": "CHEMBL1431", "disease_name": "colorectal cancer"},
-        cached_queries,
-        tmp_path,
+    """A repeat call with the same profile (any disease casing) is served from cache;
+    a changed profile misses the cache and re-queries the LLM."""
+    llm_response = '["metformin AND colorectal cancer", "biguanides AND colon"]'
+    svc = RetrievalService(tmp_path)
+    changed_profile = metformin_profile.model_copy(
+        update={"target_gene_symbols": ["PRKAA1"]}
     )
 
-    with patch(
-        "indication_scout.services.retrieval.query_small_llm",
-        new=AsyncMock(),
-    ) as mock_llm:
-        result = await RetrievalService(tmp_path).expand_search_terms(
+    with (
+        patch(
+            "indication_scout.services.retrieval.get_all_drug_names",
+            new=AsyncMock(return_value=["metformin", "glucophage"]),
+        ),
+        patch(
+            "indication_scout.services.retrieval.RetrievalService.extract_organ_term",
+            new=AsyncMock(return_value="colon"),
+        ),
+        patch(
+            "indication_scout.services.retrieval.query_small_llm",
+            new=AsyncMock(return_value=llm_response),
+        ) as mock_llm,
+    ):
+        first = await svc.expand_search_terms(
             "CHEMBL1431", "colorectal cancer", metformin_profile
         )
+        second = await svc.expand_search_terms(
+            "CHEMBL1431", " Colorectal Cancer ", metformin_profile
+        )
+        assert mock_llm.await_count == 1
+        await svc.expand_search_terms("CHEMBL1431", "colorectal cancer", changed_profile)
 
-    assert result == cached_queries
-    mock_llm.assert_not_called()
+    assert first == ["metformin AND colorectal cancer", "biguanides AND colon"]
+    assert second == first
+    assert mock_llm.await_count == 2
 
 
 # --- build_drug_profile ---
@@ -698,12 +711,14 @@ def test_insert_abstracts_calls_execute_and_commit(svc):
 
     with patch("indication_scout.services.retrieval.insert") as mock_insert:
         mock_stmt = MagicMock()
-        mock_insert.return_value.values.return_value.on_conflict_do_nothing.return_value = (
-            mock_stmt
-        )
+        mock_insert.return_value.on_conflict_do_nothing.return_value = mock_stmt
         svc.insert_abstracts(pairs, mock_db)
 
-    mock_db.execute.assert_called_once_with(mock_stmt)
+    # One executemany call: the shared statement plus one parameter row per pair.
+    mock_db.execute.assert_called_once()
+    stmt, rows = mock_db.execute.call_args.args
+    assert stmt is mock_stmt
+    assert [r["pmid"] for r in rows] == ["111", "222"]
     mock_db.commit.assert_called_once()
 
 
@@ -718,7 +733,7 @@ def test_insert_abstracts_empty_pairs_skips_db(svc):
 
 
 def test_insert_abstracts_rows_contain_all_fields(svc):
-    """Each row passed to insert() contains all expected fields including embedding."""
+    """Each parameter row passed to execute() contains all expected fields including embedding."""
     mock_db = MagicMock()
     abstract = PubmedAbstract(
         pmid="999",
@@ -730,19 +745,11 @@ def test_insert_abstracts_rows_contain_all_fields(svc):
         mesh_terms=["Diabetes"],
     )
     vector = [0.5] * 768
-    captured_rows = {}
-
-    def capture_values(rows):
-        captured_rows["rows"] = rows
-        stmt = MagicMock()
-        stmt.on_conflict_do_nothing.return_value = MagicMock()
-        return stmt
 
-    with patch("indication_scout.services.retrieval.insert") as mock_insert:
-        mock_insert.return_value.values.side_effect = capture_values
+    with patch("indication_scout.services.retrieval.insert"):
         svc.insert_abstracts([(abstract, vector)], mock_db)
 
-    row = captured_rows["rows"][0]
+    row = mock_db.execute.call_args.args[1][0]
     assert row["pmid"] == "999"
     assert row["title"] == "My Title"
     assert row["abstract"] == "My abstract"
@@ -878,6 +885,28 @@ async def test_semantic_search_returns_ranked_dicts(svc):
     assert result[1].similarity == 0.85
 
 
+async def test_semantic_search_reuses_cached_query_embedding(svc):
+    """A repeat search for the same drug/disease reads the query vector from cache."""
+    mock_db = _make_db_with_rows([])
+    mock_vector = [0.1] * 768
+
+    with (
+        patch(
+            "indication_scout.services.retrieval.get_all_drug_names",
+            new=AsyncMock(return_value=["metformin", "glucophage"]),
+        ),
+        patch(
+            "indication_scout.services.retrieval.embed_async", return_value=[mock_vector]
+        ) as mock_embed,
+    ):
+        await svc.semantic_search("colorectal cancer", "CHEMBL1431", ["111"], mock_db)
+        await svc.semantic_search("colorectal cancer", "CHEMBL1431", ["222"], mock_db)
+
+    mock_embed.assert_called_once()
+    assert mock_db.execute.call_count == 2
+    assert mock_db.execute.call_args.args[1]["query_vec"] == mock_vector
+
+
 async def test_semantic_search_embeds_therapeutic_query(svc):
     """embed() is called with the therapeutic intent query string."""
     mock_db = _make_db_with_rows([])
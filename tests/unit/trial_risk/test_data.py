@@ -2,7 +2,8 @@
 
 import json
 
-from indication_scout.trial_risk.data import load_labeled_trials
+from indication_scout.ml_models.trial_risk.data import load_labeled_trials
+from indication_scout.utils.cache import cache_set
 
 
 def _write_cache_entry(cache_dir, namespace, drug, mesh_term, trials):
@@ -78,3 +79,29 @@ def test_load_labeled_trials_terminated_wins_on_collision(tmp_path):
 def test_load_labeled_trials_empty_dirs(tmp_path):
     labeled = load_labeled_trials(tmp_path)
     assert labeled == []
+
+
+def test_load_labeled_trials_reads_compressed_cache_entries(tmp_path):
+    """Entries over the zstd size threshold are written as zstd frames by cache_set and must still load."""
+    trials = [
+        {
+            "nct_id": f"NCT{i:07d}",
+            "title": f"Trial {i} of a long-running completed study",
+            "phase": "Phase 2",
+            "overall_status": "Completed",
+            "sponsor": "Acme",
+            "enrollment": 100,
+            "mesh_conditions": [{"id": "D001", "term": "Diabetes"}],
+            "interventions": [{"intervention_type": "Drug", "intervention_name": "X"}],
+        }
+        for i in range(400)
+    ]
+    params = {"drug": "drugA", "mesh_term": "Diabetes", "date_before": None}
+    cache_set("ct_completed", params, {"total_count": 400, "trials": trials}, tmp_path)
+    [entry_file] = (tmp_path / "ct_completed").glob("*.json")
+    assert not entry_file.read_bytes().startswith(b"{")  # stored as a zstd frame
+
+    labeled = load_labeled_trials(tmp_path)
+
+    assert len(labeled) == 400
+    assert all(lt.label == 0 and lt.drug == "drugA" for lt in labeled)
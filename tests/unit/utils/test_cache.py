@@ -1,12 +1,19 @@
 """Unit tests for indication_scout.utils.cache."""
 
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
-from indication_scout.utils.cache import cache_get, cache_key, cache_set
+from indication_scout.utils.cache import (
+    ZSTD_MIN_BYTES,
+    cache_get,
+    cache_key,
+    cache_prune,
+    cache_set,
+)
 
 
 def _write_entry(path: Path, data: object, age_seconds: int, ttl: int) -> None:
@@ -69,6 +76,13 @@ def test_cache_set_writes_file(tmp_path: Path) -> None:
     assert "ttl" in entry
 
 
+def test_cache_set_replaces_entry_without_leaving_temp_files(tmp_path: Path) -> None:
+    cache_set("ns", {"k": "v"}, "first", tmp_path)
+    cache_set("ns", {"k": "v"}, "second", tmp_path)
+
+    assert cache_get("ns", {"k": "v"}, tmp_path) == "second"
+    assert [p.suffix for p in (tmp_path / "ns").iterdir()] == [".json"]
+
 def test_cache_set_custom_ttl(tmp_path: Path) -> None:
     cache_set("ns", {"k": "v"}, "data", tmp_path, ttl=999)
 
@@ -97,3 +111,94 @@ def test_cache_key_namespace_separates_identical_params() -> None:
     key1 = cache_key("organ_term", {"disease_name": "colorectal cancer"})
     key2 = cache_key("expand_search_terms", {"disease_name": "colorectal cancer"})
     assert key1 != key2
+
+
+def test_cache_set_round_trips_non_str_keys_and_dates(tmp_path: Path) -> None:
+    cache_set("ns", {"k": "v"}, {2019: datetime(2019, 5, 1, 12, 30)}, tmp_path)
+
+    result = cache_get("ns", {"k": "v"}, tmp_path)
+
+    assert result == {"2019": "2019-05-01T12:30:00"}
+
+
+def test_cache_key_is_128_bit_hex() -> None:
+    key = cache_key("organ_term", {"disease_name": "colorectal cancer"})
+    assert len(key) == 32
+    assert set(key) <= set("0123456789abcdef")
+
+
+def test_cache_set_compresses_large_entries(tmp_path: Path) -> None:
+    data = [{"disease_id": f"EFO_{i:07d}", "score": 0.5} for i in range(5000)]
+    cache_set("ns", {"k": "v"}, data, tmp_path)
+
+    key = cache_key("ns", {"k": "v"})
+    raw = (tmp_path / "ns" / f"{key}.json").read_bytes()
+    assert raw[:4] == b"\x28\xb5\x2f\xfd"
+    assert len(raw) < ZSTD_MIN_BYTES
+
+    assert cache_get("ns", {"k": "v"}, tmp_path) == data
+
+
+def test_cache_get_handles_corrupt_compressed_file(tmp_path: Path) -> None:
+    key = cache_key("ns", {"k": "v"})
+    entry_path = tmp_path / "ns" / f"{key}.json"
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    entry_path.write_bytes(b"\x28\xb5\x2f\xfd" + b"garbage")
+
+    result = cache_get("ns", {"k": "v"}, tmp_path)
+
+    assert result is None
+    assert not entry_path.exists()
+
+
+def test_cache_prune_removes_expired_legacy_and_corrupt_entries(tmp_path: Path) -> None:
+    cache_set("ns", {"k": "fresh"}, "fresh", tmp_path)
+    expired = tmp_path / "ns" / f"{cache_key('ns', {'k': 'old'})}.json"
+    _write_entry(expired, "old", age_seconds=200, ttl=100)
+    legacy = tmp_path / "ns" / f"{'a' * 64}.json"
+    _write_entry(legacy, "legacy", age_seconds=10, ttl=86400)
+    corrupt = tmp_path / "ns" / f"{'b' * 32}.json"
+    corrupt.write_text("not valid json{{")
+    foreign = tmp_path / "chembl_id_to_names" / "CHEMBL894.json"
+    foreign.parent.mkdir(parents=True)
+    foreign.write_text("{}")
+
+    removed = cache_prune(tmp_path)
+
+    assert removed == 3
+    assert cache_get("ns", {"k": "fresh"}, tmp_path) == "fresh"
+    assert not expired.exists()
+    assert not legacy.exists()
+    assert not corrupt.exists()
+    assert foreign.exists()
+
+
+def test_cache_prune_evicts_least_recently_used_over_budget(tmp_path: Path) -> None:
+    for i, k in enumerate(["old", "mid", "new"]):
+        cache_set("ns", {"k": k}, "x" * 100, tmp_path)
+        path = tmp_path / "ns" / f"{cache_key('ns', {'k': k})}.json"
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    entry_size = path.stat().st_size
+
+    removed = cache_prune(tmp_path, max_bytes=2 * entry_size)
+
+    assert removed == 1
+    assert cache_get("ns", {"k": "old"}, tmp_path) is None
+    assert cache_get("ns", {"k": "mid"}, tmp_path) == "x" * 100
+    assert cache_get("ns", {"k": "new"}, tmp_path) == "x" * 100
+
+
+def test_cache_prune_keeps_trial_risk_namespaces(tmp_path: Path) -> None:
+    """ct_completed/ct_terminated are trial_risk's training corpus: never pruned or evicted."""
+    expired = tmp_path / "ct_completed" / f"{cache_key('ct_completed', {'k': 'old'})}.json"
+    _write_entry(expired, "old", age_seconds=200, ttl=100)
+    legacy = tmp_path / "ct_terminated" / f"{'a' * 64}.json"
+    _write_entry(legacy, "legacy", age_seconds=10, ttl=86400)
+    cache_set("ns", {"k": "v"}, "x" * 100, tmp_path)
+
+    removed = cache_prune(tmp_path, max_bytes=0)
+
+    assert removed == 1
+    assert cache_get("ns", {"k": "v"}, tmp_path) is None
+    assert expired.exists()
+    assert legacy.exists()